@@ -0,0 +1,25 @@
+# _njit.py
+
+"""
+Optional Numba JIT decorator.
+
+When numba is installed, `njit` is numba's nopython decorator. Otherwise it
+degrades to a no-op so the kernels still run as plain Python/NumPy code.
+"""
+
+try:
+    from numba import njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
@@ -0,0 +1,32 @@
+"""
+Populate numba's on-disk cache for the indicator kernels.
+
+Run once after installing dependencies so short-lived runs (e.g. main.py, which
+handles a single symbol) load compiled kernels instead of JIT-compiling on first use:
+
+    python CODE_GEN/compile_kernels.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from _njit import NUMBA_AVAILABLE
+
+
+def main() -> None:
+    if not NUMBA_AVAILABLE:
+        print("numba is not installed; kernels run as plain Python, nothing to compile.")
+        return
+
+    import development_process
+    import technical_metrics_builder
+
+    start = time.perf_counter()
+    technical_metrics_builder.warm_kernels()
+    development_process.warm_kernels()
+    print(f"Compiled and cached indicator kernels in {time.perf_counter() - start:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -5,7 +8,9 @@ import re
 import sqlite3
 import time
 import sys
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional
 
 try:
     from langchain_openai import ChatOpenAI
@@ -13,43 +18,95 @@ try:
 except Exception as e:  # pragma: no cover
     raise RuntimeError(f"Missing langchain-openai dependency or incompatible version: {e}")
 
+try:  # optional faster JSON parser
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 
-DB_PATH = "data.db"
 RESOURCES_DIR = "CODE_GEN/resources"
 
+# Symbols advised per LLM call in the batch run; shared prompt parts are sent once per batch
+LLM_BATCH_SIZE = 6
+# Concurrent in-flight LLM calls in the batch run (bounded by the provider's rate limit)
+LLM_MAX_CONCURRENCY = 8
+
 # Ensure repository root is on sys.path for imports like `service.*`
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+# Identical prompts within this many seconds reuse the stored model reply (0 disables the cache)
+LLM_CACHE_TTL = 900
+# Shared with service/social_media_analyzer.py; advice replies live in their own table
+LLM_CACHE_PATH = os.path.join(PROJECT_ROOT, ".llm_cache.db")
+
+# Writes go through db_service's single long-lived read-write connection (WAL, busy_timeout)
+from service import db_service  # noqa: E402
+
 
 def _read_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read().strip()
 
 
-def _read_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _dumps_prompt(obj: Any) -> str:
+    """Compact JSON text for embedding in a prompt; orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _read_symbol_resource(path: str) -> Dict[str, Any]:
+    """
+    Parse a `{symbol}.txt` resource and keep only what the prompt uses: pair,
+    exchange, timeframe, stats and the last bar. The full bars list is dropped
+    as soon as the last element has been taken.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    bars = data.get("bars") or [{}]
+    return {
+        "pair": data.get("pair"),
+        "exchange": data.get("exchange"),
+        "timeframe": data.get("timeframe"),
+        "stats": data.get("stats", {}),
+        "last_bar": bars[-1],
+    }
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """`float(value)` for int/float input, None for anything else (missing, str, dict, ...)."""
+    return float(value) if isinstance(value, (int, float)) else None
 
 
 def _extract_latest_price(symbol_resource: Dict[str, Any]) -> Optional[float]:
     stats = symbol_resource.get("stats") or {}
-    price = stats.get("close_latest")
-    if isinstance(price, (int, float)):
-        return float(price)
-    bars = symbol_resource.get("bars") or []
-    if bars:
-        last = bars[-1]
-        close = last.get("close")
-        if isinstance(close, (int, float)):
-            return float(close)
-    return None
+    price = _as_float(stats.get("close_latest"))
+    if price is not None:
+        return price
+    return _as_float((symbol_resource.get("last_bar") or {}).get("close"))
+
+
+# Set once the advises table is known to have the extended columns
+_SCHEMA_READY = False
+_schema_lock = threading.Lock()
 
 
 def _ensure_extended_columns() -> None:
-    conn = sqlite3.connect(DB_PATH)
-    try:
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with _schema_lock:
+        if _SCHEMA_READY:
+            return
+        _migrate_extended_columns()
+        _SCHEMA_READY = True
+
+
+def _migrate_extended_columns() -> None:
+    with db_service.write_conn() as conn:
         cur = conn.cursor()
         cur.execute("PRAGMA table_info(advises)")
         cols = cur.fetchall()
@@ -68,17 +125,16 @@ def _ensure_extended_columns() -> None:
 
         for sql in migrations:
             cur.execute(sql)
-        if migrations:
-            conn.commit()
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        # Per-symbol history lookups (symbol, newest predictions) without a full table scan
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_advises_symbol_time ON advises(symbol, predicted_at)")
+
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
 
 
 def _contains_cjk(text: str) -> bool:
-    return bool(re.search(r"[\u4e00-\u9fff]", text))
+    return _CJK_RE.search(text) is not None
 
 
 def _is_english_text(text: str) -> bool:
@@ -92,88 +148,87 @@ def _is_english_text(text: str) -> bool:
         return False
     if _contains_cjk(text):
         return False
-    return bool(re.search(r"[A-Za-z]", text))
+    return _ASCII_LETTER_RE.search(text) is not None
 
 
-def _insert_advice(row: Dict[str, Any]) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO advises (
-              symbol,
-              advice_action,
-              advice_strength,
-              reason,
-              predicted_at,
-              price,
-              change_24h_percent,
-              sentiment_score,
-              volume_24h,
-              market_capacity
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                row["symbol"],
-                row["advice_action"],
-                row["advice_strength"],
-                row["reason"],
-                int(row["predicted_at"]),
-                float(row["price"]) if row.get("price") is not None else None,
-                float(row["change_24h_percent"]) if row.get("change_24h_percent") is not None else None,
-                float(row["sentiment_score"]) if row.get("sentiment_score") is not None else None,
-                float(row["volume_24h"]) if row.get("volume_24h") is not None else None,
-                float(row["market_capacity"]) if row.get("market_capacity") is not None else None,
-            ),
-        )
-        conn.commit()
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+class AdviceRow(NamedTuple):
+    """One validated advises row, fields in INSERT column order so it binds directly as parameters."""
 
+    symbol: str
+    advice_action: str
+    advice_strength: str
+    reason: str
+    predicted_at: int
+    price: float
+    change_24h_percent: Optional[float]
+    sentiment_score: Optional[float]
+    volume_24h: Optional[float]
+    market_capacity: Optional[float]
 
-def llm_summary(symbol: str, analysis_results: str) -> None:
-    """
-    Generate an investment advice using LLM with aggregated context and persist to SQLite.
 
-    Inputs:
-        symbol: Target crypto symbol, e.g., "BTC".
-        analysis_results: String containing consolidated outputs from analysis functions.
+# Built once so every insert reuses the same statement text (and sqlite3's cached prepared statement)
+_INSERT_COLS = AdviceRow._fields
+_INSERT_SQL = (
+    f"INSERT INTO advises ({', '.join(_INSERT_COLS)}) "
+    f"VALUES ({', '.join('?' * len(_INSERT_COLS))})"
+)
 
-    Behavior:
-        - Read social media context from `CODE_GEN/resources/social_media_analysis.txt`.
-        - Read `{symbol}.txt` resource JSON for 24h data and price.
-        - Call `langchain-openai` ChatOpenAI (model: gpt-5) with medium reasoning (via prompt).
-        - Require `reason` to be English and to synthesize: social media sentiment, the
-          provided analysis results, and the current price context from stats/last bar.
-        - Request and store additional numeric fields: change_24h_percent, sentiment_score (0-1),
-          volume_24h, market_capacity. Prefer values derivable from provided stats when available.
-        - Validate output fields and insert into `data.db` (table: advises) including `price` and extras.
 
-    Raises:
-        RuntimeError or ValueError on missing env, context, price, or invalid model output.
-    """
-    print(f"Generating investment advice...{symbol},{analysis_results}")
+def _insert_advice(row: AdviceRow) -> None:
+    _insert_advice_many([row])
 
-    if not symbol or not isinstance(symbol, str):
-        raise ValueError("symbol must be a non-empty string")
 
+def _insert_advice_many(rows: List[AdviceRow]) -> None:
+    """Insert all rows with one prepared statement inside a single transaction."""
+    with db_service.write_conn() as conn:
+        conn.executemany(_INSERT_SQL, rows)
+
+
+# Output schema shared by the single-symbol and batch prompts. Price, 24h change, volume
+# and market capacity are taken from the resource stats, so the model never emits them.
+_ADVICE_FIELDS = (
+    "symbol (advice symbol), advice_action (buy|hold|sell), advice_strength (high|medium|low), "
+    "reason (English), predicted_at (UNIX seconds), sentiment_score (0-1). "
+)
+_ADVICE_GUIDANCE = (
+    "Use a medium reasoning effort and keep output concise and readable. "
+    "The reason MUST synthesize three aspects: (1) social media sentiment, "
+    "(2) the provided analysis results, and (3) price data/trend from the resource summary."
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """`_read_text` memoized per (path, mtime): an edited file is re-read, an unchanged one is not."""
+    return _read_text(path)
 
-    social_path = os.path.join(RESOURCES_DIR, "social_media_analysis.txt")
-    symbol_path = os.path.join(RESOURCES_DIR, f"{symbol}.txt")
 
+@functools.lru_cache(maxsize=32)
+def _read_symbol_resource_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    `_read_symbol_resource` memoized per (path, mtime), so repeated advice for a symbol skips
+    the read and JSON parse until the resource is rewritten. The dict is shared: read it only.
+    """
+    return _read_symbol_resource(path)
+
+
+def _read_social_context() -> str:
+    social_path = os.path.join(RESOURCES_DIR, "social_media_analysis.txt")
     # Read context files (no excessive fallbacks)
     try:
-        social_context = _read_text(social_path)
+        return _read_text_cached(social_path, os.stat(social_path).st_mtime_ns)
     except Exception as e:
         raise RuntimeError(f"Failed to read social media analysis: {e}")
 
+
+def _load_symbol_context(symbol: str) -> Dict[str, Any]:
+    """Read `{symbol}.txt` and derive the prompt summary, latest price and stats-based fields."""
+    if not symbol or not isinstance(symbol, str):
+        raise ValueError("symbol must be a non-empty string")
+
+    symbol_path = os.path.join(RESOURCES_DIR, f"{symbol}.txt")
     try:
-        symbol_resource = _read_json(symbol_path)
+        symbol_resource = _read_symbol_resource_cached(symbol_path, os.stat(symbol_path).st_mtime_ns)
     except Exception as e:
         raise RuntimeError(f"Failed to read symbol resource JSON: {e}")
 
@@ -182,94 +237,207 @@ def llm_summary(symbol: str, analysis_results: str) -> None:
     if latest_price is None:
         raise RuntimeError("Latest price not available in symbol resource")
 
-    # Prepare a compact resource summary to avoid sending full payload
-    summary = {
-        "pair": symbol_resource.get("pair"),
-        "exchange": symbol_resource.get("exchange"),
-        "timeframe": symbol_resource.get("timeframe"),
-        "stats": symbol_resource.get("stats", {}),
-        # last bar snapshot (if exists)
-        "last_bar": (symbol_resource.get("bars") or [{}])[-1],
+    # The resource is already reduced to a compact summary (last bar snapshot instead of all bars)
+    summary = symbol_resource
+
+    # Derive helpful stats for robustness and to avoid model hallucination
+    stats = summary.get("stats") or {}
+    derived_change_pct = _as_float(stats.get("change_24h_percent"))
+    if derived_change_pct is None:
+        o = _as_float(stats.get("open_24h"))
+        c = _as_float(stats.get("close_latest") or latest_price)
+        if o and c is not None:
+            derived_change_pct = (c - o) / o * 100.0
+
+    derived_volume_24h = _as_float(stats.get("volume_24h"))
+    # Use quote_volume_24h as a proxy for market capacity/liquidity if market cap isn't present
+    derived_market_capacity = _as_float(stats.get("quote_volume_24h"))
+
+    return {
+        "summary": summary,
+        "latest_price": latest_price,
+        "derived_change_pct": derived_change_pct,
+        "derived_volume_24h": derived_volume_24h,
+        "derived_market_capacity": derived_market_capacity,
     }
 
-    # Initialize model
+
+@functools.lru_cache(maxsize=1)
+def _get_model() -> Any:
+    """
+    Shared ChatOpenAI client, created on first use. Reusing it keeps one HTTP
+    connection pool (keep-alive) across symbols, batches and worker threads.
+    A failed construction is not cached, so the next call retries.
+    """
     try:
-        model = ChatOpenAI(
-            model="gpt-5"        )
+        # JSON mode: decoding is constrained to a single JSON object, so replies always parse
+        return ChatOpenAI(
+            model="gpt-5",
+            model_kwargs={"response_format": {"type": "json_object"}},
+        )
     except Exception as e:
         raise RuntimeError(f"Failed to initialize ChatOpenAI: {e}")
 
-    # Derive helpful stats for robustness and to avoid model hallucination
-    stats = summary.get("stats") or {}
-    derived_change_pct = None
-    if isinstance(stats.get("change_24h_percent"), (int, float)):
-        derived_change_pct = float(stats["change_24h_percent"])
-    else:
-        try:
-            o = stats.get("open_24h")
-            c = stats.get("close_latest") or latest_price
-            if isinstance(o, (int, float)) and isinstance(c, (int, float)) and o:
-                derived_change_pct = (float(c) - float(o)) / float(o) * 100.0
-        except Exception:
-            derived_change_pct = None
-
-    derived_volume_24h = stats.get("volume_24h") if isinstance(stats.get("volume_24h"), (int, float)) else None
-    # Use quote_volume_24h as a proxy for market capacity/liquidity if market cap isn't present
-    derived_market_capacity = (
-        stats.get("quote_volume_24h") if isinstance(stats.get("quote_volume_24h"), (int, float)) else None
-    )
 
-    system_msg = SystemMessage(
-        content=(
-            "You are a crypto investment advisor. Respond strictly as JSON with the fields: "
-            "symbol (advice symbol), advice_action (buy|hold|sell), advice_strength (high|medium|low), "
-            "reason (English), predicted_at (UNIX seconds), price (number), "
-            "change_24h_percent (number), sentiment_score (0-1), volume_24h (number), market_capacity (number). "
-            "Use a medium reasoning effort and keep output concise and readable. "
-            "The reason MUST synthesize three aspects: (1) social media sentiment, "
-            "(2) the provided analysis results, and (3) price data/trend from the resource summary."
-        )
-    )
+# Model replies by prompt hash: {key: (stored_at, content)}, the most recently used
+# _RESP_CACHE_SIZE entries in front of the sidecar table
+_RESP_CACHE_SIZE = 256
+_RESP_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_resp_cache_lock = threading.Lock()
 
-    human_msg = HumanMessage(
-        content=(
-            f"symbol: {symbol}\n"
-            f"social_media_analysis: {social_context}\n"
-            f"symbol_24h_resource_summary: {json.dumps(summary, ensure_ascii=False)}\n"
-            f"analysis_results: {analysis_results}\n"
-            "Output the JSON fields listed by the system message. The reason must be in English "
-            "and explicitly synthesize social sentiment, the analysis results, and price data/trend. "
-            "For numeric fields: if the resource summary includes a value (e.g., change_24h_percent, volume_24h, "
-            "quote_volume_24h as market_capacity), copy that value; otherwise, estimate based on provided data."
-        )
+
+@functools.lru_cache(maxsize=1)
+def _cache_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS advice_cache(key TEXT PRIMARY KEY, content TEXT, created_at REAL)"
     )
+    return conn
+
+
+def _messages_key(messages: list) -> str:
+    """Exact-match key over the role and text of every message sent to the model."""
+    h = hashlib.blake2b(digest_size=20)
+    for m in messages:
+        h.update(type(m).__name__.encode("utf-8"))
+        h.update(b"\x00")
+        h.update(m.content.encode("utf-8"))
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+def _remember_reply(key: str, entry: tuple) -> None:
+    """Put `entry` in the in-process LRU, evicting the least recently used; caller holds the lock."""
+    _RESP_CACHE[key] = entry
+    _RESP_CACHE.move_to_end(key)
+    while len(_RESP_CACHE) > _RESP_CACHE_SIZE:
+        _RESP_CACHE.popitem(last=False)
+
+
+def _cached_reply(key: str) -> Optional[str]:
+    """Stored reply for `key` if it is younger than LLM_CACHE_TTL, else None."""
+    if LLM_CACHE_TTL <= 0:
+        return None
+    with _resp_cache_lock:
+        hit = _RESP_CACHE.get(key)
+        if hit is None:
+            try:
+                hit = _cache_conn().execute(
+                    "SELECT created_at, content FROM advice_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logging.warning("LLM cache lookup failed: %s", e)
+                hit = None
+        if hit is not None:
+            _remember_reply(key, hit)
+    if hit is None or time.time() - hit[0] >= LLM_CACHE_TTL:
+        return None
+    return hit[1]
+
+
+def _store_reply(key: str, content: str) -> None:
+    """
+    Cache a reply whose advice rows are committed, and drop sidecar rows that have
+    outlived LLM_CACHE_TTL. Never called for a reply that failed validation or insert,
+    so a retry calls the model again instead of replaying it.
+    """
+    if LLM_CACHE_TTL <= 0:
+        return
+    entry = (time.time(), content)
+    with _resp_cache_lock:
+        _remember_reply(key, entry)
+        try:
+            conn = _cache_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO advice_cache(key, content, created_at) VALUES (?, ?, ?)",
+                (key, content, entry[0]),
+            )
+            conn.execute("DELETE FROM advice_cache WHERE created_at <= ?", (entry[0] - LLM_CACHE_TTL,))
+            conn.commit()
+        except sqlite3.Error as e:
+            logging.warning("LLM cache write failed: %s", e)
 
-    # Invoke model and parse JSON
+
+class LLMReply(NamedTuple):
+    """A parsed model reply and the prompt key it is cached under once its advice is stored."""
+
+    data: Any
+    content: str
+    key: str
+    from_cache: bool
+
+
+def _invoke_json(model: Any, messages: list) -> LLMReply:
+    """
+    Invoke the model and parse its reply.
+    A reply to the identical prompt stored within LLM_CACHE_TTL is reused without a call
+    (from_cache=True); its advice was committed before it was cached, so the caller must
+    not insert it again. A fresh reply is not cached here: the caller stores it with
+    `_store_reply` only after its advice rows are committed.
+    """
+    key = _messages_key(messages)
+    cached = _cached_reply(key)
+    if cached is not None:
+        return LLMReply(_parse_advice_json(cached), cached, key, True)
     try:
-        resp = model.invoke([system_msg, human_msg])
+        resp = model.invoke(messages)
     except Exception as e:
         raise RuntimeError(f"LLM invocation failed: {e}")
+    data, content = _reply_json(resp)
+    return LLMReply(data, content, key, False)
+
 
+async def _ainvoke_json(model: Any, messages: list) -> LLMReply:
+    """
+    Async `_invoke_json`: awaits `model.ainvoke` so many calls can be in flight on one loop.
+    The blocking cache lookup runs in a worker thread.
+    """
+    key = _messages_key(messages)
+    cached = await asyncio.to_thread(_cached_reply, key)
+    if cached is not None:
+        return LLMReply(_parse_advice_json(cached), cached, key, True)
+    try:
+        resp = await model.ainvoke(messages)
+    except Exception as e:
+        raise RuntimeError(f"LLM invocation failed: {e}")
+    data, content = _reply_json(resp)
+    return LLMReply(data, content, key, False)
+
+
+def _reply_json(resp: Any) -> tuple:
+    """Validate and parse the model reply; returns (parsed JSON, raw content)."""
     content = getattr(resp, "content", None)
     if not content or not isinstance(content, str):
         raise RuntimeError("LLM returned empty content")
 
+    return _parse_advice_json(content), content
+
+
+def _parse_advice_json(content: str) -> Any:
+    """Parse the model reply, with orjson when installed; the stdlib parser is the fallback."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
     try:
-        data = json.loads(content)
+        return json.loads(content)
     except Exception as e:
         raise RuntimeError(f"LLM output is not valid JSON: {e}\nRaw: {content}")
 
+
+def _build_row(symbol: str, data: Dict[str, Any], ctx: Dict[str, Any]) -> AdviceRow:
+    """Validate one model advice object against `symbol` and resolve it into an advises row."""
+    if not isinstance(data, dict):
+        raise ValueError("LLM advice must be a JSON object")
+
     # Validate fields (minimal, no excessive fallbacks)
     symbol_out = data.get("symbol")
     action = data.get("advice_action")
     strength = data.get("advice_strength")
     reason = data.get("reason")
-    predicted_at = data.get("predicted_at")
-    price_out = data.get("price")
-    change_24h_percent_out = data.get("change_24h_percent")
-    sentiment_score_out = data.get("sentiment_score")
-    volume_24h_out = data.get("volume_24h")
-    market_capacity_out = data.get("market_capacity")
+    predicted_at = _as_float(data.get("predicted_at"))
+    sentiment_score = _as_float(data.get("sentiment_score"))
 
     if symbol_out != symbol:
         raise ValueError("LLM output symbol mismatch")
@@ -279,78 +447,286 @@ def llm_summary(symbol: str, analysis_results: str) -> None:
         raise ValueError("Invalid advice_strength")
     if not isinstance(reason, str) or not reason.strip() or not _is_english_text(reason):
         raise ValueError("reason must be non-empty English text without CJK characters")
-    if not isinstance(predicted_at, (int, float)):
-        # keep minimal fallback: use current time seconds
-        predicted_at = int(time.time())
-    else:
-        predicted_at = int(predicted_at)
-
-    # Prefer extracted latest price over model-produced price to ensure consistency
-    final_price = latest_price
-
-    # Resolve extended numeric fields, preferring derived stats
-    final_change_pct = None
-    if isinstance(derived_change_pct, (int, float)):
-        final_change_pct = float(derived_change_pct)
-    elif isinstance(change_24h_percent_out, (int, float)):
-        final_change_pct = float(change_24h_percent_out)
-
-    final_volume_24h = None
-    if isinstance(derived_volume_24h, (int, float)):
-        final_volume_24h = float(derived_volume_24h)
-    elif isinstance(volume_24h_out, (int, float)):
-        final_volume_24h = float(volume_24h_out)
-
-    final_market_capacity = None
-    if isinstance(derived_market_capacity, (int, float)):
-        final_market_capacity = float(derived_market_capacity)
-    elif isinstance(market_capacity_out, (int, float)):
-        final_market_capacity = float(market_capacity_out)
-
-    final_sentiment = None
-    if isinstance(sentiment_score_out, (int, float)):
+    # keep minimal fallback: use current time seconds
+    predicted_at = int(time.time()) if predicted_at is None else int(predicted_at)
+    if sentiment_score is not None:
         # Clamp to [0,1] as required
-        final_sentiment = max(0.0, min(1.0, float(sentiment_score_out)))
+        sentiment_score = max(0.0, min(1.0, sentiment_score))
 
-    # Ensure price is numeric
-    if not isinstance(final_price, (int, float)):
+    # Price and the extended numeric fields come from the resource (already floats or None)
+    final_price = ctx["latest_price"]
+    if final_price is None:
         raise ValueError("Missing numeric price for insert")
 
+    return AdviceRow(
+        symbol,
+        action,
+        strength,
+        reason.strip(),
+        predicted_at,
+        final_price,
+        ctx["derived_change_pct"],
+        sentiment_score,
+        ctx["derived_volume_24h"],
+        ctx["derived_market_capacity"],
+    )
+
+
+def llm_summary(symbol: str, analysis_results: str, social_context: Optional[str] = None) -> None:
+    """
+    Generate an investment advice using LLM with aggregated context and persist to SQLite.
+
+    Inputs:
+        symbol: Target crypto symbol, e.g., "BTC".
+        analysis_results: String containing consolidated outputs from analysis functions.
+        social_context: Social media analysis text; read (and cached) from the resources dir when None.
+
+    Behavior:
+        - Read social media context from `CODE_GEN/resources/social_media_analysis.txt`.
+        - Read `{symbol}.txt` resource JSON for 24h data and price.
+        - Call `langchain-openai` ChatOpenAI (model: gpt-5) with medium reasoning (via prompt).
+        - Require `reason` to be English and to synthesize: social media sentiment, the
+          provided analysis results, and the current price context from stats/last bar.
+        - Request sentiment_score (0-1) from the model; store price, change_24h_percent, volume_24h
+          and market_capacity (quote volume proxy) derived locally from the resource stats.
+        - Validate output fields and insert into `data.db` (table: advises) including `price` and extras.
+        - A reply reused from the reply cache (see `_invoke_json`) was already inserted and is not stored again;
+          a reply is cached only after its row is committed.
+
+    Raises:
+        RuntimeError or ValueError on missing env, context, price, or invalid model output.
+    """
+    print(f"Generating investment advice...{symbol},{analysis_results}")
+
+    if not symbol or not isinstance(symbol, str):
+        raise ValueError("symbol must be a non-empty string")
+
+    if social_context is None:
+        social_context = _read_social_context()
+    ctx = _load_symbol_context(symbol)
+
+    # Initialize model
+    model = _get_model()
+
+    system_msg = SystemMessage(
+        content=(
+            "You are a crypto investment advisor. Respond strictly as JSON with the fields: "
+            + _ADVICE_FIELDS
+            + _ADVICE_GUIDANCE
+        )
+    )
+
+    human_msg = HumanMessage(
+        content=(
+            f"symbol: {symbol}\n"
+            f"social_media_analysis: {social_context}\n"
+            f"symbol_24h_resource_summary: {_dumps_prompt(ctx['summary'])}\n"
+            f"analysis_results: {analysis_results}\n"
+            "Output the JSON fields listed by the system message. The reason must be in English "
+            "and explicitly synthesize social sentiment, the analysis results, and price data/trend."
+        )
+    )
+
+    # Invoke model and parse JSON
+    reply = _invoke_json(model, [system_msg, human_msg])
+    row = _build_row(symbol, reply.data, ctx)
+    if reply.from_cache:
+        # The row for this reply was inserted before the reply was cached
+        logging.info("Reused cached advice for %s; not inserting it again", symbol)
+        return reply.content
+
     # Ensure DB schema and insert
     _ensure_extended_columns()
-    row = {
-        "symbol": symbol,
-        "advice_action": action,
-        "advice_strength": strength,
-        "reason": reason.strip(),
-        "predicted_at": predicted_at,
-        "price": float(final_price),
-        "change_24h_percent": final_change_pct,
-        "sentiment_score": final_sentiment,
-        "volume_24h": final_volume_24h,
-        "market_capacity": final_market_capacity,
-    }
 
     try:
         _insert_advice(row)
-        logging.info("Inserted advice: %s @ %d", symbol, predicted_at)
-        return content
     except Exception as e:
         raise RuntimeError(f"Failed to insert advice: {e}")
+    logging.info("Inserted advice: %s @ %d", symbol, row.predicted_at)
+    _store_reply(reply.key, reply.content)
+    return reply.content
+
+
+def llm_summary_batch(
+    symbols: List[str], analysis_results: Dict[str, str], social_context: Optional[str] = None
+) -> Dict[str, AdviceRow]:
+    """
+    Batch variant of `llm_summary`: one LLM call advises on several symbols at once
+    (see `_advise_batch`), and the valid rows are inserted in one transaction.
+
+    Returns:
+        {symbol: inserted row} for every symbol that was persisted.
+
+    Raises:
+        RuntimeError if the shared context cannot be read, the LLM call fails or the insert fails.
+    """
+    rows, reply = _advise_batch(symbols, analysis_results, social_context)
+    if rows:
+        _ensure_extended_columns()
+        try:
+            _insert_advice_many(list(rows.values()))
+        except Exception as e:
+            raise RuntimeError(f"Failed to insert advice batch: {e}")
+        logging.info("Inserted %d advices in one batch", len(rows))
+    if reply is not None:
+        _store_reply(reply.key, reply.content)
+    return rows
+
+
+def _advise_batch(
+    symbols: List[str], analysis_results: Dict[str, str], social_context: Optional[str] = None
+) -> tuple:
+    """
+    Ask the LLM for advice on all `symbols` in one call and return
+    ({symbol: validated row}, reply to cache once the rows are committed, or None)
+    without touching the database.
+
+    The system message, social media context and output instructions are sent once
+    for the whole batch; each symbol contributes only its resource summary and
+    analysis results. Symbols whose context cannot be loaded, or whose advice is
+    missing or fails validation, are logged and skipped without affecting the rest.
+    """
+    contexts, messages = _batch_prompt(symbols, analysis_results, social_context)
+    if not contexts:
+        return {}, None
+    return _fresh_batch_rows(contexts, _invoke_json(_get_model(), messages))
+
+
+async def _aadvise_batch(
+    symbols: List[str], analysis_results: Dict[str, str], social_context: Optional[str] = None
+) -> tuple:
+    """Async `_advise_batch`, awaiting the LLM reply instead of blocking on it."""
+    contexts, messages = _batch_prompt(symbols, analysis_results, social_context)
+    if not contexts:
+        return {}, None
+    return _fresh_batch_rows(contexts, await _ainvoke_json(_get_model(), messages))
+
+
+def _batch_prompt(
+    symbols: List[str], analysis_results: Dict[str, str], social_context: Optional[str]
+) -> tuple:
+    """Load each symbol's context and build the batch messages; returns (contexts, messages)."""
+    print(f"Generating investment advice batch...{list(symbols)}")
+
+    if social_context is None:
+        social_context = _read_social_context()
+    contexts: Dict[str, Dict[str, Any]] = {}
+    for symbol in symbols:
+        try:
+            contexts[symbol] = _load_symbol_context(symbol)
+        except Exception as e:
+            logging.error("Skipping %s: %s", symbol, e)
+    if not contexts:
+        return contexts, []
+
+    system_msg = SystemMessage(
+        content=(
+            "You are a crypto investment advisor. Respond strictly as JSON of the form "
+            '{"results": [...]} holding exactly one advice object per requested symbol, each with the fields: '
+            + _ADVICE_FIELDS
+            + _ADVICE_GUIDANCE
+        )
+    )
+
+    requests = [
+        {
+            "symbol": symbol,
+            "symbol_24h_resource_summary": ctx["summary"],
+            "analysis_results": analysis_results.get(symbol, ""),
+        }
+        for symbol, ctx in contexts.items()
+    ]
+    human_msg = HumanMessage(
+        content=(
+            f"social_media_analysis: {social_context}\n"
+            f"symbols: {_dumps_prompt(requests)}\n"
+            "For every entry in symbols, output one advice object with the JSON fields listed by the "
+            "system message. Each reason must be in English and explicitly synthesize social sentiment, "
+            "that symbol's analysis results, and its price data/trend."
+        )
+    )
+    return contexts, [system_msg, human_msg]
+
+
+def _fresh_batch_rows(contexts: Dict[str, Dict[str, Any]], reply: LLMReply) -> tuple:
+    """
+    `_batch_rows` plus the reply to cache after they are committed. A cached reply
+    yields no rows (they were committed before it was cached); a reply that left any
+    symbol without valid advice is not cached, so the next run asks for it again.
+    """
+    if reply.from_cache:
+        logging.info("Reused cached advice for %s; not inserting it again", list(contexts))
+        return {}, None
+    rows = _batch_rows(contexts, reply.data)
+    return rows, (reply if len(rows) == len(contexts) else None)
+
+
+def _batch_rows(contexts: Dict[str, Dict[str, Any]], data: Any) -> Dict[str, AdviceRow]:
+    """Validate the batch reply's advice objects against the requested symbols."""
+    results = data.get("results") if isinstance(data, dict) else None
+    if not isinstance(results, list):
+        raise RuntimeError("LLM batch output has no results array")
+
+    advice_by_symbol = {item.get("symbol"): item for item in results if isinstance(item, dict)}
+    rows: Dict[str, AdviceRow] = {}
+    for symbol, ctx in contexts.items():
+        try:
+            rows[symbol] = _build_row(symbol, advice_by_symbol.get(symbol), ctx)
+        except Exception as e:
+            logging.error("Invalid advice for %s: %s", symbol, e)
+    return rows
+
+
+async def _advise_all(batches: List[List[str]], social_context: str) -> tuple:
+    """
+    Run every batch's LLM call concurrently on one event loop (at most
+    LLM_MAX_CONCURRENCY in flight) and return (all validated rows, replies to
+    cache once those rows are committed). A failed batch is logged and
+    contributes no rows.
+    """
+    semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+    async def _one(batch: List[str]) -> tuple:
+        async with semaphore:
+            return await _aadvise_batch(batch, {symbol: "Data analysis is optimistic" for symbol in batch}, social_context)
+
+    results = await asyncio.gather(*(_one(batch) for batch in batches), return_exceptions=True)
+
+    rows: List[AdviceRow] = []
+    replies: List[LLMReply] = []
+    for batch, result in zip(batches, results):
+        if isinstance(result, BaseException):
+            # Continue processing other batches if one fails
+            logging.error("Failed processing %s: %s", batch, result)
+            result = ({}, None)
+        batch_rows, reply = result
+        for symbol in batch:
+            print(f"Processed {symbol}: {symbol in batch_rows}")
+        rows.extend(batch_rows.values())
+        if reply is not None:
+            replies.append(reply)
+    return rows, replies
+
 
 if __name__ == "__main__":
-    # Invoke llm_summary once for every tracked symbol
+    # Advise on every tracked symbol, LLM_BATCH_SIZE symbols per LLM call
     try:
-        from service.cryptocurrency_service import get_tracking_cryptocurrenc
+        from service.cryptocurrency_service import get_tracking_cryptocurrencies
     except Exception as e:  # pragma: no cover
         raise RuntimeError(f"Failed to import tracking symbols: {e}")
 
-    symbols = get_tracking_cryptocurrenc()
-    for sym in symbols:
-        try:
-            result = llm_summary(symbol=sym, analysis_results="Data analysis is optimistic")
-            print(f"Processed {sym}: {bool(result)}")
-        except Exception as e:
-            # Continue processing other symbols if one fails
-            logging.error("Failed processing %s: %s", sym, e)
-            continue
+    symbols = get_tracking_cryptocurrencies()
+    batches = [list(symbols[i:i + LLM_BATCH_SIZE]) for i in range(0, len(symbols), LLM_BATCH_SIZE)]
+    # Shared by every batch: read once here instead of once per LLM call
+    social_context = _read_social_context()
+    # Batches are independent (separate resources, separate rows): their LLM requests are
+    # issued concurrently with ainvoke. Every validated row is then written here in one transaction.
+    rows, replies = asyncio.run(_advise_all(batches, social_context))
+
+    if rows:
+        _ensure_extended_columns()
+        _insert_advice_many(rows)
+        logging.info("Inserted %d advices for %d tracked symbols", len(rows), len(symbols))
+    # Cached only now that their rows are committed, so a failed run is asked again
+    for reply in replies:
+        _store_reply(reply.key, reply.content)
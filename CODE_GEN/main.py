@@ -4,19 +4,24 @@ Entry point to run a single-symbol analysis and invoke llm_summary.
 - Reads the symbol from design-time resources (hardcoded here as instructed).
 - Calls market_data_analysis, dev_data_analysis, chain_data_analysis.
 - Builds a summary string that includes function names and stringified results
-  (including explicit None when functions return None).
+  (including explicit None when functions return None); DataFrames are reduced to
+  shape, columns and their latest row.
 - Invokes final_analysis.llm_summary(symbol, analysis_results=summary).
 
 Notes:
-- Only one symbol is handled (no loops or concurrency).
+- Only one symbol is handled (no symbol loop).
+- The three analyses are independent and run concurrently on a small thread pool.
 - Minimal error handling with concise logs.
 - Python 3.10+, PEP8, and type annotations; all strings/logs are English.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
+import pandas as pd
+
 
 def _safe_imports() -> tuple[
     Optional[Any], Optional[Any], Optional[Any], Optional[Any]
@@ -82,6 +87,14 @@ def _stringify(name: str, value: Optional[Any]) -> str:
     """Return a concise string for the summary including explicit None."""
     if value is None:
         return f"{name}: None"
+    if isinstance(value, pd.DataFrame):
+        # Summarize structurally rather than rendering the whole frame as a text table
+        if value.empty:
+            return f"{name}: empty DataFrame"
+        return (
+            f"{name}: shape={value.shape} cols={list(value.columns)} "
+            f"last_row[{value.index[-1]}]={value.iloc[-1].to_dict()}"
+        )
     try:
         return f"{name}: {str(value)}"
     except Exception:
@@ -89,22 +102,25 @@ def _stringify(name: str, value: Optional[Any]) -> str:
 
 
 def main() -> None:
-    # Single symbol only (no loops or concurrency)
+    # Single symbol only (no symbol loop)
     symbol: str = "BNB"
     print(f"Starting analysis for {symbol}...")
 
     market_fn, dev_fn, chain_fn, llm_fn = _safe_imports()
 
-    market_res: Optional[Any] = _safe_call("market_data_analysis", market_fn, symbol)
-    dev_res: Optional[Any] = _safe_call("dev_data_analysis", dev_fn, symbol)
-    chain_res: Optional[Any] = _safe_call("chain_data_analysis", chain_fn, symbol)
+    analyses = (
+        ("market_data_analysis", market_fn),
+        ("dev_data_analysis", dev_fn),
+        ("chain_data_analysis", chain_fn),
+    )
+    # No data dependency between the analyses: overlap their file reads and pandas work.
+    # _safe_call already logs failures and returns None, so result() does not raise.
+    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = {name: executor.submit(_safe_call, name, fn, symbol) for name, fn in analyses}
+    results: dict[str, Optional[Any]] = {name: fut.result() for name, fut in futures.items()}
 
     # Build summary string (single line, explicit None allowed)
-    summary_parts = [
-        _stringify("market_data_analysis", market_res),
-        _stringify("dev_data_analysis", dev_res),
-        _stringify("chain_data_analysis", chain_res),
-    ]
+    summary_parts = [_stringify(name, results[name]) for name, _ in analyses]
     summary: str = "; ".join(summary_parts)
     print("Summary ready.")
 
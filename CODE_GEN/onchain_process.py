@@ -5,9 +5,45 @@ import numpy as np
 import json
 import os
 
+try:  # optional C moving-window kernels
+    import bottleneck as bn  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    bn = None  # type: ignore
+
+
+def _rolling_mean(s: pd.Series, window: int):
+    """`s.rolling(window).mean()`; Bottleneck's moving-window kernel on the raw array when installed."""
+    if bn is not None and window <= len(s):
+        return bn.move_mean(s.to_numpy(dtype=np.float64), window)
+    return s.rolling(window=window).mean()
+
+
+def _rolling_sum(s: pd.Series, window: int):
+    """`s.rolling(window).sum()`; Bottleneck's moving-window kernel on the raw array when installed."""
+    if bn is not None and window <= len(s):
+        return bn.move_sum(s.to_numpy(dtype=np.float64), window)
+    return s.rolling(window=window).sum()
+
+
+def _pct_change(s: pd.Series, periods: int):
+    """
+    `s.pct_change(periods)` as one shifted division on the raw array
+    (x[t] / x[t - periods] - 1, NaN for the first `periods` rows).
+    Inputs with gaps go through pandas, which pads them first.
+    """
+    x = s.to_numpy(dtype=np.float64)
+    if np.isnan(x).any():
+        return s.pct_change(periods=periods)
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] > periods:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(x[periods:], x[:-periods], out=out[periods:])
+        out[periods:] -= 1.0
+    return out
+
 # --- 1. Metric Calculation Functions (Provided by you) ---
 
-def calculate_onchain_ratios(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_onchain_ratios(df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
     """
     Calculates key on-chain ratio metrics: MVRV and SOPR.
 
@@ -16,8 +52,10 @@ def calculate_onchain_ratios(df: pd.DataFrame) -> pd.DataFrame:
 
     Output: 
         DataFrame with added columns: 'MVRV_Ratio', 'SOPR_MA_7', 'SOPR_Signal'.
+        With inplace=True the columns are added to `df` itself instead of a copy.
     """
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
 
     # 1. MVRV (Market Value to Realized Value) Ratio
     # Assumes 'UTXO_Realized_Price' represents the Realized Value per coin.
@@ -28,13 +66,13 @@ def calculate_onchain_ratios(df: pd.DataFrame) -> pd.DataFrame:
     
     # 2. SOPR (Spent Output Profit Ratio) Moving Average
     if 'SOPR_Raw' in df.columns:
-        df['SOPR_MA_7'] = df['SOPR_Raw'].rolling(window=7).mean()
+        df['SOPR_MA_7'] = _rolling_mean(df['SOPR_Raw'], 7)
         # 3. SOPR Signal (Profitability check)
-        df['SOPR_Signal'] = np.where(df['SOPR_MA_7'] > 1.0, 1, 0)
+        df['SOPR_Signal'] = np.where(df['SOPR_MA_7'] > 1.0, 1, 0).astype(np.int8)
     
     return df
 
-def calculate_onchain_flows(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_onchain_flows(df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
     """
     Calculates on-chain flow metrics: Exchange Netflow and Non-Zero Address Growth.
 
@@ -43,18 +81,20 @@ def calculate_onchain_flows(df: pd.DataFrame) -> pd.DataFrame:
 
     Output: 
         DataFrame with added columns: 'Netflow_Acc_48', 'Netflow_Signal', 'NZ_Address_Growth_48'.
+        With inplace=True the columns are added to `df` itself instead of a copy.
     """
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # 1. Exchange Netflow Accumulation
     if 'Exchange_Netflow_USD' in df.columns:
-        df['Netflow_Acc_48'] = df['Exchange_Netflow_USD'].rolling(window=48).sum()
+        df['Netflow_Acc_48'] = _rolling_sum(df['Exchange_Netflow_USD'], 48)
         # 2. Netflow Signal (Accumulation vs. Distribution)
-        df['Netflow_Signal'] = np.where(df['Netflow_Acc_48'] < 0, 1, -1) 
+        df['Netflow_Signal'] = np.where(df['Netflow_Acc_48'] < 0, 1, -1).astype(np.int8)
 
     # 3. Non-Zero Addresses Growth Rate
     if 'Non_Zero_Addresses' in df.columns:
-        df['NZ_Address_Growth_48'] = df['Non_Zero_Addresses'].pct_change(periods=48)
+        df['NZ_Address_Growth_48'] = _pct_change(df['Non_Zero_Addresses'], 48)
     
     return df
 
@@ -83,43 +123,35 @@ def load_raw_chain_data(symbol: str) -> pd.DataFrame:
     if not entries:
         return pd.DataFrame()
         
-    # Flatten the nested JSON structure
-    data_list = []
+    # Flatten the nested JSON structure into parallel column lists
+    ts, utxo_price, active_addr, whale_bal = [], [], [], []
     for entry in entries:
-        # Extract nested dictionaries
-        val_metrics = entry.get("valuation_metrics", {})
-        net_activity = entry.get("network_activity", {})
-        supply_dist = entry.get("supply_distribution", {})
-        
-        # 1. Get Base Data
-        utxo_price = val_metrics.get("utxo_realized_price", 0)
-        active_addr = net_activity.get("active_addresses", 0)
-        whale_bal = supply_dist.get("whale_aggregate_balance", 0)
-        
-        # 2. Derive/Simulate Missing Columns (Since simulator might not output Market Close directly)
-        # In a real app, you would merge this with market_data (OHLCV).
-        # Here, we simulate 'Close' relative to Realized Price to allow MVRV calc.
-        simulated_close = utxo_price * 1.15 # Assuming market is slightly above realized price
-        
-        # Simulate SOPR (Fluctuating around 1.0)
-        simulated_sopr = 1.0 + (np.random.random() - 0.5) * 0.05
-        
-        # Simulate Netflow based on Whale Balance changes (Proxy)
-        # Note: We can't calc delta here easily row-by-row without DF, so we store raw balance first
-        
-        row = {
-            "timestamp": entry.get("timestamp"),
+        # 1. Get Base Data from the nested dictionaries
+        ts.append(entry.get("timestamp"))
+        utxo_price.append(entry.get("valuation_metrics", {}).get("utxo_realized_price", 0))
+        active_addr.append(entry.get("network_activity", {}).get("active_addresses", 0))
+        whale_bal.append(entry.get("supply_distribution", {}).get("whale_aggregate_balance", 0))
+
+    utxo_price = np.asarray(utxo_price)
+    n = utxo_price.shape[0]
+
+    index = pd.to_datetime(ts)
+    index.name = 'timestamp'
+
+    # 2. Derive/Simulate Missing Columns (Since simulator might not output Market Close directly)
+    # In a real app, you would merge this with market_data (OHLCV).
+    # Here, we simulate 'Close' relative to Realized Price to allow MVRV calc.
+    df = pd.DataFrame(
+        {
             "UTXO_Realized_Price": utxo_price,
-            "Non_Zero_Addresses": active_addr, # Using active addresses as proxy
-            "Whale_Balance": whale_bal,
-            "Close": simulated_close,          # Synthetic for demo
-            "SOPR_Raw": simulated_sopr         # Synthetic for demo
-        }
-        data_list.append(row)
-        
-    df = pd.DataFrame(data_list)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df.set_index('timestamp', inplace=True)
+            "Non_Zero_Addresses": np.asarray(active_addr),  # Using active addresses as proxy
+            "Whale_Balance": np.asarray(whale_bal),
+            "Close": utxo_price * 1.15,  # Synthetic for demo: market slightly above realized price
+            # Synthetic SOPR fluctuating around 1.0, drawn for all rows at once
+            "SOPR_Raw": 1.0 + (np.random.random(n) - 0.5) * 0.05,
+        },
+        index=index,
+    )
     
     # Calculate Netflow from Whale Balance Change (Negative change = Outflow/Sell, Positive = Inflow/Buy)
     # *Note*: For Exchange Netflow, Inflow is usually bad (sell pressure). 
@@ -153,10 +185,11 @@ def chain_data_analysis(symbol: str) -> pd.DataFrame:
         print(f"No chain data found for {symbol}")
         return df
         
+    # The freshly loaded frame is owned here, so both steps add their columns in place
     # 2. Calculate Ratios (MVRV, SOPR)
-    df = calculate_onchain_ratios(df)
+    df = calculate_onchain_ratios(df, inplace=True)
     
     # 3. Calculate Flows (Netflow, Growth)
-    df = calculate_onchain_flows(df)
+    df = calculate_onchain_flows(df, inplace=True)
     
     return df
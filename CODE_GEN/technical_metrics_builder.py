@@ -2,35 +2,327 @@
 
 import pandas as pd
 import numpy as np
+import functools
 import json
 import os
-import ta
+from concurrent.futures import ThreadPoolExecutor
+from numpy.lib.stride_tricks import sliding_window_view
 
-# Import specific indicators
-from ta.trend import EMAIndicator, SMAIndicator, MACD, CCIIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator, ChaikinMoneyFlowIndicator
+from _njit import njit, NUMBA_AVAILABLE
 
-# --- 1. Data Loading ---
+try:  # optional faster JSON parser
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
-def load_data_by_symbol(symbol):
+# --- 0. Rolling Kernels ---
+# Each kernel declares its one signature, so numba compiles it eagerly at import (loading the
+# machine code from __pycache__ when cached) instead of on the first call. Arrays use any
+# layout, since DataFrame columns are not guaranteed contiguous; fastmath stays off because
+# the kernels rely on NaN checks.
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _linreg_endpoint(close, window):
     """
-    Reads a JSON file for a specific symbol and converts the 'bars' list into a Pandas DataFrame.
-    path: CODE_GEN/resources/{symbol}.txt
+    Rolling least-squares line over x=0..window-1, evaluated at the window's last point.
+    Running sums of y and x*y are slid in O(1) per step; sums over x are constants.
+    NaNs are counted and contribute 0, so windows containing one yield NaN.
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_dir, "resources", f"{symbol}.txt")
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
 
-    if not os.path.exists(file_path):
-        # Fallback for relative paths if run from root
-        file_path = os.path.join("CODE_GEN", "resources", f"{symbol}.txt")
-        if not os.path.exists(file_path):
-             return pd.DataFrame()
+    sum_x = window * (window - 1) / 2.0
+    sum_x2 = (window - 1) * window * (2 * window - 1) / 6.0
+    denom = window * sum_x2 - sum_x * sum_x
+
+    sum_y = 0.0
+    sum_xy = 0.0
+    nan_count = 0
+    for j in range(window):
+        y = close[j]
+        if np.isnan(y):
+            nan_count += 1
+        else:
+            sum_y += y
+            sum_xy += j * y
+
+    for i in range(window - 1, n):
+        if i >= window:
+            # Drop the point at x=0, shift the rest down by one, append at x=window-1
+            old = close[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+                old = 0.0
+            new = close[i]
+            if np.isnan(new):
+                nan_count += 1
+                new = 0.0
+            sum_y -= old
+            sum_xy -= sum_y
+            sum_y += new
+            sum_xy += (window - 1) * new
+
+        if nan_count == 0:
+            slope = (window * sum_xy - sum_x * sum_y) / denom
+            intercept = (sum_y - slope * sum_x) / window
+            out[i] = slope * (window - 1) + intercept
+
+    return out
+
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _rolling_std(x, window):
+    """Rolling sample standard deviation (ddof=1) via a sliding Welford update."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if n < window or window < 2:
+        return out
+
+    mean = 0.0
+    m2 = 0.0
+    nan_count = 0
+    for j in range(window):
+        v = x[j]
+        if np.isnan(v):
+            nan_count += 1
+            v = 0.0
+        delta = v - mean
+        mean += delta / (j + 1)
+        m2 += delta * (v - mean)
+
+    for i in range(window - 1, n):
+        if i >= window:
+            old = x[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+                old = 0.0
+            new = x[i]
+            if np.isnan(new):
+                nan_count += 1
+                new = 0.0
+            old_mean = mean
+            mean += (new - old) / window
+            m2 += (new - old) * (new - mean + old - old_mean)
+
+        if nan_count == 0:
+            out[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+
+    return out
+
+
+@njit("float64[:](float64[:], float64[:], int64)", cache=True)
+def _chop(high, low, window):
+    """
+    Choppiness Index in one sweep: running sum of (high - low) plus rolling max(high) /
+    min(low) kept in monotonic index deques stored as ring buffers of size `window`.
+    """
+    n = high.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    log_window = np.log10(window)
+
+    max_q = np.empty(window, dtype=np.int64)
+    min_q = np.empty(window, dtype=np.int64)
+    max_head = 0
+    max_len = 0
+    min_head = 0
+    min_len = 0
+    hl_sum = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        h = high[i]
+        l = low[i]
+        valid = not (np.isnan(h) or np.isnan(l))
+        if valid:
+            hl_sum += h - l
+        else:
+            nan_count += 1
+
+        if i >= window:
+            oh = high[i - window]
+            ol = low[i - window]
+            if np.isnan(oh) or np.isnan(ol):
+                nan_count -= 1
+            else:
+                hl_sum -= oh - ol
+            if max_len > 0 and max_q[max_head] <= i - window:
+                max_head = (max_head + 1) % window
+                max_len -= 1
+            if min_len > 0 and min_q[min_head] <= i - window:
+                min_head = (min_head + 1) % window
+                min_len -= 1
+
+        if valid:
+            while max_len > 0 and high[max_q[(max_head + max_len - 1) % window]] <= h:
+                max_len -= 1
+            max_q[(max_head + max_len) % window] = i
+            max_len += 1
+            while min_len > 0 and low[min_q[(min_head + min_len - 1) % window]] >= l:
+                min_len -= 1
+            min_q[(min_head + min_len) % window] = i
+            min_len += 1
+
+        if i >= window - 1 and nan_count == 0:
+            range_diff = high[max_q[max_head]] - low[min_q[min_head]]
+            if range_diff != 0:
+                out[i] = 100.0 * np.log10(hl_sum / range_diff) / log_window
+
+    return out
+
+
+@njit("float64[:](float64[:], int64, int64, int64)", cache=True)
+def _macd_hist(close, fast, slow, signal):
+    """
+    MACD histogram in one pass: the fast and slow EMAs of close and the signal EMA of
+    their difference are updated together per bar. Each EMA matches pandas
+    ewm(span=window, adjust=False) seeded with its first observation, and is NaN until
+    `window` observations have been seen. NaN closes hold the state.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    a_fast = 2.0 / (fast + 1.0)
+    a_slow = 2.0 / (slow + 1.0)
+    a_signal = 2.0 / (signal + 1.0)
+    warmup = max(fast, slow)
+    e_fast = 0.0
+    e_slow = 0.0
+    e_signal = 0.0
+    count = 0
+    signal_count = 0
+    for i in range(n):
+        v = close[i]
+        if not np.isnan(v):
+            if count == 0:
+                e_fast = v
+                e_slow = v
+            else:
+                e_fast = a_fast * v + (1.0 - a_fast) * e_fast
+                e_slow = a_slow * v + (1.0 - a_slow) * e_slow
+            count += 1
+        if count >= warmup:
+            macd = e_fast - e_slow
+            if signal_count == 0:
+                e_signal = macd
+            else:
+                e_signal = a_signal * macd + (1.0 - a_signal) * e_signal
+            signal_count += 1
+            if signal_count >= signal:
+                out[i] = macd - e_signal
+    return out
+
+
+@njit("float64[:](float64[:], int64, boolean)", cache=True)
+def _wilder(x, window, sma_seed):
+    """
+    Wilder smoothing (alpha = 1/window), NaN for the first window-1 entries.
+    sma_seed=True starts from the mean of the first `window` values (classic ATR);
+    otherwise the recursion is seeded with x[0], as in pandas ewm(alpha=1/window, adjust=False).
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    if sma_seed:
+        value = x[:window].mean()
+        out[window - 1] = value
+        for i in range(window, n):
+            value = (value * (window - 1) + x[i]) / window
+            out[i] = value
+    else:
+        value = x[0]
+        for i in range(1, n):
+            value += (x[i] - value) / window
+            if i >= window - 1:
+                out[i] = value
+    return out
+
+
+def _rolling_sum(a, window):
+    """Rolling sum via cumulative-sum differencing; the first window-1 entries are NaN."""
+    out = np.full(a.shape[0], np.nan)
+    if a.shape[0] < window:
+        return out
+    c = np.concatenate(([0.0], np.cumsum(a)))
+    out[window - 1:] = c[window:] - c[:-window]
+    return out
+
+
+def _linreg_endpoint_vectorized(close, window):
+    """Closed-form OLS endpoint over all windows at once (no per-window polyfit)."""
+    out = np.full(close.shape[0], np.nan)
+    if close.shape[0] < window:
+        return out
+    x = np.arange(window, dtype=np.float64)
+    x_mean = x.mean()
+    x_centered = x - x_mean
+    denom = (x_centered ** 2).sum()
+
+    windows = sliding_window_view(close, window)
+    y_mean = windows.mean(axis=1)
+    slope = ((windows - y_mean[:, None]) * x_centered).sum(axis=1) / denom
+    out[window - 1:] = slope * (window - 1 - x_mean) + y_mean
+    return out
+
+
+def _rolling_std_vectorized(x, window):
+    """Rolling sample standard deviation (ddof=1) over strided windows."""
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] < window or window < 2:
+        return out
+    out[window - 1:] = sliding_window_view(x, window).std(axis=1, ddof=1)
+    return out
+
+
+def _chop_vectorized(high, low, window):
+    """Choppiness Index over strided windows."""
+    out = np.full(high.shape[0], np.nan)
+    if high.shape[0] < window:
+        return out
+    high_w = sliding_window_view(high, window)
+    low_w = sliding_window_view(low, window)
+    hl_sum = (high_w - low_w).sum(axis=1)
+    range_diff = high_w.max(axis=1) - low_w.min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[window - 1:] = np.where(range_diff != 0, 100 * np.log10(hl_sum / range_diff) / np.log10(window), np.nan)
+    return out
+
+
+# Without numba the loop kernels run as plain Python; the strided NumPy versions are faster there.
+if not NUMBA_AVAILABLE:
+    _linreg_endpoint = _linreg_endpoint_vectorized
+    _rolling_std = _rolling_std_vectorized
+    _chop = _chop_vectorized
+
+
+def warm_kernels():
+    """
+    Calls every jitted kernel once on a small float64 array. The kernels are already
+    compiled (and written to __pycache__) at import; this checks they run.
+    """
+    x = np.linspace(1.0, 2.0, 32)
+    _linreg_endpoint(x, 20)
+    _rolling_std(x, 20)
+    _chop(x + 0.1, x, 14)
+    _macd_hist(x, 12, 26, 9)
+    _wilder(x, 14, True)
+    _wilder(x, 14, False)
+
+# --- 1. Data Loading ---
 
+@functools.lru_cache(maxsize=32)
+def _load_bars_frame(file_path, mtime):
+    """
+    Parses the JSON file into a DataFrame. Cached per (path, mtime), so an edited
+    file is re-parsed while repeated loads of an unchanged file skip JSON decoding.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return pd.DataFrame()
 
@@ -38,7 +330,10 @@ def load_data_by_symbol(symbol):
     if not bars:
         return pd.DataFrame()
 
-    df = pd.DataFrame(bars)
+    # Build column lists directly rather than letting pandas walk a list of row dicts.
+    # Bars may omit keys (None values are stripped when saved), so take the ordered union.
+    keys = dict.fromkeys(k for bar in bars for k in bar)
+    df = pd.DataFrame({k: [bar.get(k) for bar in bars] for k in keys})
 
     if 'timestamp' in df.columns:
         df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -48,94 +343,208 @@ def load_data_by_symbol(symbol):
     core_cols = ['open', 'high', 'low', 'close', 'volume']
     for col in core_cols:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            # Store each OHLCV column as its own contiguous float64 array for the numeric kernels.
+            # float32 is not enough here: stablecoin closes (~1.0001) lose their intraday moves.
+            # Only non-numeric (e.g. string) columns need coercion; numeric JSON values already are.
+            values = df[col] if pd.api.types.is_numeric_dtype(df[col]) else pd.to_numeric(df[col], errors='coerce')
+            df[col] = np.ascontiguousarray(values.to_numpy(), dtype=np.float64)
 
     return df
 
+def load_data_by_symbol(symbol):
+    """
+    Reads a JSON file for a specific symbol and converts the 'bars' list into a Pandas DataFrame.
+    path: CODE_GEN/resources/{symbol}.txt
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(base_dir, "resources", f"{symbol}.txt")
+
+    if not os.path.exists(file_path):
+        # Fallback for relative paths if run from root
+        file_path = os.path.join("CODE_GEN", "resources", f"{symbol}.txt")
+        if not os.path.exists(file_path):
+             return pd.DataFrame()
+
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return pd.DataFrame()
+
+    # Callers add columns to the result, so hand out a copy of the cached frame
+    return _load_bars_frame(os.path.abspath(file_path), mtime).copy()
+
+def load_many(symbols, max_workers=None):
+    """
+    Loads several symbols' bars concurrently (file reads release the GIL; parsed frames
+    land in the shared per-mtime cache). Returns {symbol: DataFrame} in the order given.
+    """
+    symbols = list(symbols)
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, len(symbols))) as executor:
+        return dict(zip(symbols, executor.map(load_data_by_symbol, symbols)))
+
 # --- 2. Basic Indicators Calculation ---
+# Each builder adds exactly one output column to df in place.
 
-def calculate_indicators(df):
-    """Calculates standard technical indicators."""
-    df = df.copy()
-    if len(df) < 14: return df 
+def _add_macd_hist(df):
+    # We keep MACD Hist as it shows momentum shift: (EMA12 - EMA26) minus its 9-period EMA
+    df['MACD_Hist'] = _macd_hist(df['close'].to_numpy(dtype=np.float64), 12, 26, 9) # Predictive of crossovers
 
-    # Trend
-    # (Intermediate MAs removed from final output, but needed for calculation if referencing later)
-    # We keep MACD Hist as it shows momentum shift
-    macd = MACD(close=df['close'], window_slow=26, window_fast=12, window_sign=9)
-    df['MACD_Hist'] = macd.macd_diff() # Predictive of crossovers
-    
-    df['CCI_14'] = CCIIndicator(high=df['high'], low=df['low'], close=df['close'], window=14).cci()
+def _add_cci(df):
+    # Cyclic Trend: typical price vs its 14-period mean, scaled by the mean absolute deviation.
+    # All windows are reduced at once instead of a Python MAD callback per window.
+    window = 14
+    tp = (df['high'].to_numpy(dtype=np.float64) + df['low'].to_numpy(dtype=np.float64)
+          + df['close'].to_numpy(dtype=np.float64)) / 3.0
+    cci = np.full(tp.shape[0], np.nan)
+    if tp.shape[0] >= window:
+        windows = sliding_window_view(tp, window)
+        tp_mean = windows.mean(axis=1)
+        mad = np.abs(windows - tp_mean[:, None]).mean(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cci[window - 1:] = (tp[window - 1:] - tp_mean) / (0.015 * mad)
+    df['CCI_14'] = cci
 
-    # Momentum
-    df['RSI_14'] = RSIIndicator(close=df['close'], window=14).rsi()
-    
-    # Volatility
-    df['ATR_14'] = AverageTrueRange(high=df['high'], low=df['low'], close=df['close'], window=14).average_true_range()
-    
-    bb = BollingerBands(close=df['close'], window=20, window_dev=2.0)
+def _add_rsi(df):
+    # Momentum: RSI from Wilder-smoothed gains/losses
+    close = df['close'].to_numpy(dtype=np.float64)
+    diff = np.diff(close, prepend=close[0])
+    avg_gain = _wilder(np.where(diff > 0, diff, 0.0), 14, False)
+    avg_loss = _wilder(np.where(diff < 0, -diff, 0.0), 14, False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['RSI_14'] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+def _add_atr(df):
+    # Volatility: ATR as the SMA-seeded Wilder average of the true range
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    df['ATR_14'] = _wilder(true_range, 14, True)
+
+def _add_bb_pct_b(df):
     # Calculate %B (Percent Bandwidth) - shows where price is relative to bands (0=Lower, 1=Upper)
     # This is more predictive/actionable than just raw band values
-    df['BB_Pct_B'] = (df['close'] - bb.bollinger_lband()) / (bb.bollinger_hband() - bb.bollinger_lband())
-    
-    # Volume
-    df['OBV_calc'] = OnBalanceVolumeIndicator(close=df['close'], volume=df['volume']).on_balance_volume()
+    # Bands are 20-period mean +/- 2 population std, from one pass over strided windows
+    close = df['close'].to_numpy(dtype=np.float64)
+    bb_pct_b = np.full(close.shape[0], np.nan)
+    if close.shape[0] >= 20:
+        windows = sliding_window_view(close, 20)
+        bb_mid = windows.mean(axis=1)
+        bb_std = windows.std(axis=1, ddof=0)
+        bb_lower = bb_mid - 2.0 * bb_std
+        bb_upper = bb_mid + 2.0 * bb_std
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bb_pct_b[19:] = (close[19:] - bb_lower) / (bb_upper - bb_lower)
+    df['BB_Pct_B'] = bb_pct_b
+
+def _add_obv(df):
+    # Volume: OBV adds volume on up closes, subtracts on down closes, ignores unchanged closes
+    close = df['close'].to_numpy(dtype=np.float64)
+    direction = np.sign(np.diff(close, prepend=close[0]))
+    df['OBV_calc'] = np.cumsum(direction * df['volume'].to_numpy(dtype=np.float64))
+
+def calculate_indicators(df):
+    """Calculates standard technical indicators. Adds columns to df in place and returns it."""
+    if len(df) < 14: return df 
+
+    # Only indicators that reach the filtered output are computed; intermediate MAs are not materialized.
+    for build in (_add_macd_hist, _add_cci, _add_rsi, _add_atr, _add_bb_pct_b, _add_obv):
+        build(df)
 
     return df
 
 # --- 3. Advanced Metrics Calculation ---
 
-def calculate_advanced_metrics(df):
-    """Calculates advanced market structure metrics."""
-    df = df.copy()
-    if len(df) < 24: return df
-
+def _add_vwap_dev(df):
     # A. VWAP Deviation (Predictive of Mean Reversion)
-    v = df['volume'].values
-    tp = (df['high'] + df['low'] + df['close']) / 3
-    vwap = (pd.Series(tp * v).rolling(window=24).sum() / pd.Series(v).rolling(window=24).sum())
-    # Metric: Percentage distance from VWAP
-    df['VWAP_Dev_Pct'] = ((df['close'] - vwap) / vwap) * 100
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    tp = (df['high'].to_numpy(dtype=np.float64) + df['low'].to_numpy(dtype=np.float64) + close) / 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = _rolling_sum(tp * volume, 24) / _rolling_sum(volume, 24)
+        # Metric: Percentage distance from VWAP
+        df['VWAP_Dev_Pct'] = ((close - vwap) / vwap) * 100
 
-    # B. CMF (Trend Confirmation)
-    df['CMF_20'] = ChaikinMoneyFlowIndicator(
-        high=df['high'], low=df['low'], close=df['close'], volume=df['volume'], window=20
-    ).chaikin_money_flow()
+def _add_cmf(df):
+    # B. CMF (Trend Confirmation): 20-period money flow volume over 20-period volume
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mfm = ((close - low) - (high - close)) / (high - low)
+        # A flat bar (high == low) has no defined multiplier and contributes no flow
+        mfv = np.where(np.isnan(mfm), 0.0, mfm) * volume
+        df['CMF_20'] = _rolling_sum(mfv, 20) / _rolling_sum(volume, 20)
 
+def _add_chop(df):
     # C. CHOP (Market State)
-    high_low_diff = df['high'] - df['low']
-    atr_sum = high_low_diff.rolling(window=14).sum()
-    high_max = df['high'].rolling(window=14).max()
-    low_min = df['low'].rolling(window=14).min()
-    range_diff = high_max - low_min
-    df['CHOP_14'] = 100 * np.log10(atr_sum / range_diff.replace(0, np.nan)) / np.log10(14)
+    df['CHOP_14'] = _chop(df['high'].to_numpy(dtype=np.float64), df['low'].to_numpy(dtype=np.float64), 14)
 
+def _add_reg_outlier(df):
     # D. Linear Regression Outlier Signal
     window = 20
-    x_range = np.arange(window)
-    def rolling_linreg(y_window):
-        m, c = np.polyfit(x_range, y_window, 1)
-        return m * (window - 1) + c
-
-    lin_mid = df['close'].rolling(window=window).apply(rolling_linreg, raw=True)
-    lin_std = df['close'].rolling(window=window).std()
+    close = df['close'].to_numpy(dtype=np.float64)
+    lin_mid = _linreg_endpoint(close, window)
+    lin_std = _rolling_std(close, window)
     lin_upper = lin_mid + (2 * lin_std)
     lin_lower = lin_mid - (2 * lin_std)
     
     # Signal: 1 (Overbought), -1 (Oversold), 0 (Normal)
     df['Reg_Outlier_Signal'] = np.where(
-        df['close'] > lin_upper, 1, 
-        np.where(df['close'] < lin_lower, -1, 0)
+        close > lin_upper, 1, 
+        np.where(close < lin_lower, -1, 0)
     )
 
+def calculate_advanced_metrics(df):
+    """Calculates advanced market structure metrics. Adds columns to df in place and returns it."""
+    if len(df) < 24: return df
+
+    for build in (_add_vwap_dev, _add_cmf, _add_chop, _add_reg_outlier):
+        build(df)
+
     return df
 
+# Output column -> (minimum rows, builder); the row minimums mirror the guards above.
+INDICATOR_BUILDERS = {
+    'MACD_Hist': (14, _add_macd_hist),
+    'CCI_14': (14, _add_cci),
+    'RSI_14': (14, _add_rsi),
+    'ATR_14': (14, _add_atr),
+    'BB_Pct_B': (14, _add_bb_pct_b),
+    'OBV_calc': (14, _add_obv),
+    'VWAP_Dev_Pct': (24, _add_vwap_dev),
+    'CMF_20': (24, _add_cmf),
+    'CHOP_14': (24, _add_chop),
+    'Reg_Outlier_Signal': (24, _add_reg_outlier),
+}
+
+# The list of actionable signals returned by market_data_analysis
+PREDICTIVE_COLUMNS = [
+    'Close_Price',          # Context
+    'RSI_14',               # Momentum (Oversold/Overbought)
+    'MACD_Hist',            # Momentum Change (Divergence/Crossover proxy)
+    'CCI_14',               # Cyclic Trend
+    'BB_Pct_B',             # Volatility Position (0 to 1)
+    'ATR_14',               # Volatility Magnitude (for Stop Loss sizing)
+    'CMF_20',               # Money Flow Pressure
+    'VWAP_Dev_Pct',         # Mean Reversion Potential
+    'CHOP_14',              # Market Regime (Trend vs Range)
+    'Reg_Outlier_Signal',   # Statistical Extremes
+    'OBV_calc'              # Volume Trend
+]
+
 # --- 4. Master Function (Filtered Output) ---
 
-def market_data_analysis(symbol):
+def market_data_analysis(symbol, dtype=np.float64):
     """
     Loads data and returns a concise DataFrame of HIGH-VALUE, PREDICTIVE indicators.
     Removes raw price columns (Open/High/Low) and intermediate Moving Averages.
+    Indicators are always computed in float64; `dtype` only sets the returned block's
+    precision (np.float32 halves its size but blurs stablecoin prices such as Close_Price).
     """
     # 1. Load
     df = load_data_by_symbol(symbol)
@@ -145,27 +554,18 @@ def market_data_analysis(symbol):
     # Preserve Close price for context, but drop others later
     df['Close_Price'] = df['close'] 
 
-    # 2. Calculate All
-    df = calculate_indicators(df)
-    df = calculate_advanced_metrics(df)
+    # 2. Calculate only the indicators that appear in the filtered output
+    for col in PREDICTIVE_COLUMNS:
+        if col in INDICATOR_BUILDERS:
+            min_rows, build = INDICATOR_BUILDERS[col]
+            if len(df) >= min_rows:
+                build(df)
     
     # 3. Filter for Predictive/High-Order Metrics Only
-    # We define the list of actionable signals
-    predictive_columns = [
-        'Close_Price',          # Context
-        'RSI_14',               # Momentum (Oversold/Overbought)
-        'MACD_Hist',            # Momentum Change (Divergence/Crossover proxy)
-        'CCI_14',               # Cyclic Trend
-        'BB_Pct_B',             # Volatility Position (0 to 1)
-        'ATR_14',               # Volatility Magnitude (for Stop Loss sizing)
-        'CMF_20',               # Money Flow Pressure
-        'VWAP_Dev_Pct',         # Mean Reversion Potential
-        'CHOP_14',              # Market Regime (Trend vs Range)
-        'Reg_Outlier_Signal',   # Statistical Extremes
-        'OBV_calc'              # Volume Trend
-    ]
-    
     # Select only existing columns (intersection) to avoid errors on short data
-    final_cols = [c for c in predictive_columns if c in df.columns]
-    
-    return df[final_cols]
\ No newline at end of file
+    final_cols = [c for c in PREDICTIVE_COLUMNS if c in df.columns]
+
+    # Materialize the projection as one C-contiguous block (rows x signals), so
+    # .to_numpy() hands downstream consumers a single row-major array without copying.
+    block = np.column_stack([df[c].to_numpy(dtype=dtype) for c in final_cols])
+    return pd.DataFrame(block, index=df.index, columns=final_cols, copy=False)
\ No newline at end of file
@@ -1,15 +1,109 @@
+import functools
 import json
 import os
-import random
-import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+try:  # optional faster JSON encoder
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # optional JIT for the numeric kernel
+    from numba import njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    NUMBA_AVAILABLE = False
+    njit = None  # type: ignore
 
 # Define the symbols to simulate
 TARGET_SYMBOLS = ["USDT", "BTC", "ETH", "USDC", "SOL", "XRP", "ZEC", "BNB", "DOGE"]
 
-def generate_chain_data(symbol):
+# 24 hours of 30-minute periods
+PERIODS = 48
+
+# One generator shared by all symbols; set SIM_SEED for a reproducible run
+_seed = os.environ.get("SIM_SEED")
+_rng = np.random.default_rng(int(_seed) if _seed else None)
+
+@functools.lru_cache(maxsize=None)
+def _symbol_params(symbol):
+    """Per-symbol simulation constants (different scales for BTC/ETH vs others)."""
+    is_major = symbol in ("BTC", "ETH")
+    return {
+        # Blocks produced in 30 mins (approx 10 mins per block for BTC, 12s for ETH)
+        "blocks_added": 3 if symbol == "BTC" else (150 if symbol == "ETH" else 400),
+        "block_time_avg": 600 if symbol == "BTC" else 12, # seconds
+        "tx_base": 2000 if is_major else 500,
+        "vol_base": 50000000 if is_major else 10000000,
+        "base_fee": 5.0 if symbol == "ETH" else (2.0 if symbol == "BTC" else 0.01),
+        "base_price": 60000 if symbol == "BTC" else (3000 if symbol == "ETH" else 100),
+        "whale_start": 5000000 if is_major else 100000000, # Abstract units
+        "whale_scale": 1 if is_major else 10,
+    }
+
+def _chain_kernel_vectorized(start_height, blocks_added, tx_base, vol_base, base_fee, base_price,
+                             whale_start, busyness, vol_jitter, active_jitter, new_jitter,
+                             price_jitter, whale_flows):
+    """
+    Derived chain metrics from the random draws; index i = periods before now.
+    Returns (heights, tx_counts, tx_volumes, avg_fees, active, new, utxo_prices, whale_balances).
+    """
+    block_heights = (start_height - np.cumsum(np.full(busyness.shape[0], blocks_added))).astype(np.int32) # Working backwards in time
+    tx_counts = (tx_base * busyness).astype(np.int32)
+    tx_volumes = vol_base * busyness * vol_jitter
+    # Gas Fee (Higher when busy)
+    avg_gas_fees = base_fee * (busyness * busyness)
+    active_addresses = (tx_counts * active_jitter).astype(np.int32)
+    new_addresses = (active_addresses * new_jitter).astype(np.int32)
+    utxo_realized_prices = base_price * price_jitter
+    whale_balances = whale_start - np.cumsum(whale_flows) # Reversing the flow since we go backwards
+    return (block_heights, tx_counts, tx_volumes, avg_gas_fees, active_addresses,
+            new_addresses, utxo_realized_prices, whale_balances)
+
+def _chain_kernel_loop(start_height, blocks_added, tx_base, vol_base, base_fee, base_price,
+                       whale_start, busyness, vol_jitter, active_jitter, new_jitter,
+                       price_jitter, whale_flows):
+    """Single fused pass computing the same columns as _chain_kernel_vectorized."""
+    n = busyness.shape[0]
+    block_heights = np.empty(n, np.int32)
+    tx_counts = np.empty(n, np.int32)
+    tx_volumes = np.empty(n, np.float64)
+    avg_gas_fees = np.empty(n, np.float64)
+    active_addresses = np.empty(n, np.int32)
+    new_addresses = np.empty(n, np.int32)
+    utxo_realized_prices = np.empty(n, np.float64)
+    whale_balances = np.empty(n, np.float64)
+    height = start_height
+    outflow = 0.0
+    for i in range(n):
+        b = busyness[i]
+        height -= blocks_added
+        outflow += whale_flows[i]
+        block_heights[i] = height
+        tx_counts[i] = int(tx_base * b)
+        tx_volumes[i] = vol_base * b * vol_jitter[i]
+        avg_gas_fees[i] = base_fee * (b * b)
+        active_addresses[i] = int(tx_counts[i] * active_jitter[i])
+        new_addresses[i] = int(active_addresses[i] * new_jitter[i])
+        utxo_realized_prices[i] = base_price * price_jitter[i]
+        whale_balances[i] = whale_start - outflow
+    return (block_heights, tx_counts, tx_volumes, avg_gas_fees, active_addresses,
+            new_addresses, utxo_realized_prices, whale_balances)
+
+# With numba the fused loop is compiled; otherwise the NumPy version is the faster one.
+if NUMBA_AVAILABLE:
+    _chain_kernel = njit(cache=True)(_chain_kernel_loop)
+else:
+    _chain_kernel = _chain_kernel_vectorized
+
+def generate_chain_columns(symbol):
     """
-    Simulates raw on-chain data for the past 24 hours with 30-minute granularity.
+    Simulates raw on-chain data for the past 24 hours with 30-minute granularity,
+    returned column-oriented: one NumPy array per metric, ordered Old -> New.
     
     Data points included:
     1. Block Info: Block Height, Block Time.
@@ -22,78 +116,86 @@ def generate_chain_data(symbol):
     # Adjust to the nearest 30-minute mark
     now = now.replace(minute=30 if now.minute >= 30 else 0, second=0, microsecond=0)
     
-    chain_data_entries = []
-    
-    # Base parameters for simulation (different scales for BTC/ETH vs others)
-    is_major = symbol in ["BTC", "ETH"]
+    params = _symbol_params(symbol)
+    rng = _rng
     
     # Initial states for cumulative metrics
-    current_block_height = 8000000 + random.randint(0, 100000)
-    current_whale_balance = 5000000 if is_major else 100000000 # Abstract units
+    current_block_height = 8000000 + int(rng.integers(0, 100001))
     
-    # Generate data for the past 24 hours (48 periods of 30 mins)
-    for i in range(48):
-        time_point = now - timedelta(minutes=30 * i)
-        timestamp_str = time_point.isoformat() + "Z"
-        
-        # --- 1. Block Info ---
-        # Blocks produced in 30 mins (approx 10 mins per block for BTC, 12s for ETH)
-        blocks_added = 3 if symbol == "BTC" else (150 if symbol == "ETH" else 400)
-        current_block_height -= blocks_added # Working backwards in time loop
-        
-        # --- 2. Transactions & Fees ---
-        # Random fluctuation based on network busyness
-        busyness = random.uniform(0.8, 1.5)
-        
-        tx_count = int((2000 if is_major else 500) * busyness)
-        tx_volume = (50000000 if is_major else 10000000) * busyness * random.uniform(0.5, 2.0)
-        
-        # Gas Fee (Higher when busy)
-        base_fee = 5.0 if symbol == "ETH" else (2.0 if symbol == "BTC" else 0.01)
-        avg_gas_fee = base_fee * (busyness ** 2)
-        
-        # --- 3. Network Addresses ---
-        active_addresses = int(tx_count * random.uniform(1.2, 1.8))
-        new_addresses = int(active_addresses * random.uniform(0.05, 0.15))
-        
-        # --- 4. UTXO / Valuation (Simulated) ---
-        # Realized Price often trails market price. Simulating a slow moving average.
-        # We assume a base price for simplicity.
-        base_price = 60000 if symbol == "BTC" else (3000 if symbol == "ETH" else 100)
-        utxo_realized_price = base_price * random.uniform(0.8, 0.95) # Usually lower than current price in bull market
-        
-        # --- 5. Whale Activity ---
-        # Random inflow/outflow from whales
-        whale_flow = random.uniform(-5000, 5000) * (10 if not is_major else 1)
-        current_whale_balance -= whale_flow # Reversing the flow since we loop backwards
-        
-        entry = {
-            "timestamp": timestamp_str,
+    # Generate data for the past 24 hours (48 periods of 30 mins), index i = periods before now.
+    # All random draws are made as (48,) vectors; the kernel derives the metrics from them.
+    # --- Transactions & Fees: random fluctuation based on network busyness ---
+    busyness = rng.uniform(0.8, 1.5, PERIODS)
+    vol_jitter = rng.uniform(0.5, 2.0, PERIODS)
+    # --- Network Addresses ---
+    active_jitter = rng.uniform(1.2, 1.8, PERIODS)
+    new_jitter = rng.uniform(0.05, 0.15, PERIODS)
+    # --- UTXO / Valuation: Realized Price trails market price, usually lower in a bull market ---
+    price_jitter = rng.uniform(0.8, 0.95, PERIODS)
+    # --- Whale Activity: random inflow/outflow from whales ---
+    whale_flows = rng.uniform(-5000, 5000, PERIODS) * params["whale_scale"]
+    
+    (block_heights, tx_counts, tx_volumes, avg_gas_fees, active_addresses, new_addresses,
+     utxo_realized_prices, whale_balances) = _chain_kernel(
+        current_block_height, params["blocks_added"], params["tx_base"], params["vol_base"],
+        float(params["base_fee"]), params["base_price"], float(params["whale_start"]),
+        busyness, vol_jitter, active_jitter, new_jitter, price_jitter, whale_flows,
+    )
+    
+    # Timestamps for all periods in one vectorized datetime64 computation
+    timestamps = np.datetime_as_string(np.datetime64(now, 's') - np.arange(PERIODS) * np.timedelta64(30, 'm'), unit='s')
+    
+    # Integer columns are int32 (heights/counts stay far below 2**31). Float columns
+    # stay float64: USD volumes and whale balances reach ~1e8, where float32 can no
+    # longer hold the 2-decimal values written to the JSON.
+    # Sort by time in ascending order (Old -> New)
+    return {
+        "timestamp": timestamps[::-1],
+        "height": block_heights[::-1],
+        "block_time_avg": np.full(PERIODS, params["block_time_avg"], dtype=np.int32),
+        "tx_count": tx_counts[::-1],
+        "tx_volume_usd": np.round(tx_volumes, 2)[::-1],
+        "avg_fee_usd": np.round(avg_gas_fees, 4)[::-1],
+        "active_addresses": active_addresses[::-1],
+        "new_addresses": new_addresses[::-1],
+        "utxo_realized_price": np.round(utxo_realized_prices, 2)[::-1],
+        "whale_aggregate_balance": np.round(whale_balances, 2)[::-1],
+    }
+
+def to_entries(columns):
+    """Zip column arrays back into the legacy nested per-period dict records."""
+    rows = zip(*(columns[name].tolist() for name in (
+        "timestamp", "height", "block_time_avg", "tx_count", "tx_volume_usd", "avg_fee_usd",
+        "active_addresses", "new_addresses", "utxo_realized_price", "whale_aggregate_balance",
+    )))
+    return [
+        {
+            "timestamp": timestamp + "Z",
             "block_summary": {
-                "height": current_block_height,
-                "block_time_avg": 600 if symbol == "BTC" else 12 # seconds
+                "height": height,
+                "block_time_avg": block_time_avg
             },
             "transaction_metrics": {
                 "count": tx_count,
-                "volume_usd": round(tx_volume, 2),
-                "avg_fee_usd": round(avg_gas_fee, 4)
+                "volume_usd": tx_volume,
+                "avg_fee_usd": avg_fee
             },
             "network_activity": {
-                "active_addresses": active_addresses,
-                "new_addresses": new_addresses
+                "active_addresses": active,
+                "new_addresses": new
             },
             "valuation_metrics": {
-                "utxo_realized_price": round(utxo_realized_price, 2)
+                "utxo_realized_price": utxo_price
             },
             "supply_distribution": {
-                "whale_aggregate_balance": round(current_whale_balance, 2)
+                "whale_aggregate_balance": whale_balance
             }
         }
-        chain_data_entries.append(entry)
-        
-    # Sort by time in ascending order (Old -> New)
-    chain_data_entries.reverse()
-    
+        for timestamp, height, block_time_avg, tx_count, tx_volume, avg_fee, active, new, utxo_price, whale_balance in rows
+    ]
+
+def generate_chain_data(symbol):
+    """Simulated on-chain dataset for `symbol` in the legacy nested JSON layout."""
     # Construct final JSON
     final_json = {
         "symbol": symbol,
@@ -103,28 +205,51 @@ def generate_chain_data(symbol):
             "period": "24h",
             "granularity": "30min"
         },
-        "chain_data": chain_data_entries
+        "chain_data": to_entries(generate_chain_columns(symbol))
     }
     
     return final_json
 
+def _output_dir():
+    # Construct path: ./CODE_GEN/chain
+    return os.path.abspath(os.path.join(".", "CODE_GEN", "chain"))
+
+def ensure_output_dir():
+    base_dir = _output_dir()
+    os.makedirs(base_dir, exist_ok=True)
+    return base_dir
+
+def render_chain_file(symbol, data):
+    """Return (file_path, encoded JSON bytes) for a symbol's dataset without touching the disk."""
+    file_path = os.path.join(_output_dir(), f"{symbol}.txt")
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(data, indent=2).encode("utf-8")
+    return file_path, body
+
+def _write_payload(payload):
+    # Unbuffered: hand the whole encoded document to the kernel in one write() call
+    file_path, body = payload
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(body)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return file_path
+
 def save_chain_file(symbol, data):
-    # Construct path: ../CODE_GEN/chain/{symbol}.txt
-    base_dir = os.path.abspath(os.path.join(".", "CODE_GEN", "chain"))
-    
-    if not os.path.exists(base_dir):
-        print(f"Creating directory: {base_dir}")
-        os.makedirs(base_dir)
-        
-    file_path = os.path.join(base_dir, f"{symbol}.txt")
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-        
+    """Write a symbol's dataset; the caller runs ensure_output_dir() once beforehand."""
+    file_path = _write_payload(render_chain_file(symbol, data))
     print(f"✅ [Chain Sim] Saved on-chain data for {symbol} to {file_path}")
 
 if __name__ == "__main__":
     print("--- Starting Chain Data Simulation (Last 24h) ---")
-    for sym in TARGET_SYMBOLS:
-        chain_json = generate_chain_data(sym)
-        save_chain_file(sym, chain_json)
\ No newline at end of file
+    # Generate and encode everything first, then write all files as one batch
+    payloads = [render_chain_file(sym, generate_chain_data(sym)) for sym in TARGET_SYMBOLS]
+    ensure_output_dir()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for sym, file_path in zip(TARGET_SYMBOLS, executor.map(_write_payload, payloads)):
+            print(f"✅ [Chain Sim] Saved on-chain data for {sym} to {file_path}")
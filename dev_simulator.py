@@ -1,57 +1,94 @@
 # simulator.py
 import json
 import os
-import random
-import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+try:  # optional faster JSON encoder
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 # Define the token symbols we want to simulate
 TARGET_SYMBOLS = ["USDT", "BTC", "ETH", "USDC", "SOL", "XRP", "ZEC", "BNB", "DOGE"]
 
-def generate_scraped_data(symbol):
+# 24 hours of 30-minute periods
+PERIODS = 48
+
+# One generator shared by all symbols; set SIM_SEED for a reproducible run
+_seed = os.environ.get("SIM_SEED")
+_rng = np.random.default_rng(int(_seed) if _seed else None)
+
+def generate_scraped_columns(symbol):
     """
     Simulates raw development activity data scraped from GitHub/GitLab for the past 24 hours.
-    Data granularity is 30 minutes.
+    Data granularity is 30 minutes. Returned column-oriented: one NumPy array per
+    metric, ordered Old -> New.
     """
     now = datetime.utcnow()
     # Adjust time to the nearest 30-minute mark
     now = now.replace(minute=30 if now.minute >= 30 else 0, second=0, microsecond=0)
     
-    raw_data_entries = []
+    rng = _rng
+    
+    # Generate data for the past 24 hours (24 * 2 = 48 data points), index i = periods before now.
+    # All random draws are made as (48,) int32 vectors.
     
-    # Generate data for the past 24 hours (24 * 2 = 48 data points)
-    for i in range(48):
-        time_point = now - timedelta(minutes=30 * i)
-        timestamp_str = time_point.isoformat() + "Z"
-        
-        # Simulate base commit counts (random fluctuation)
-        # BTC/ETH are usually higher, others are lower
-        base_activity = random.randint(0, 15) if symbol in ["BTC", "ETH"] else random.randint(0, 5)
-        
-        # Occasional bursts (Merge Request merges)
-        if random.random() > 0.9:
-            base_activity += random.randint(10, 30)
-            
-        # Simulate core developer ratio (usually a small fraction of total commits)
-        core_dev_count = int(base_activity * random.uniform(0.2, 0.6))
-        
-        # Construct a single record similar to an API response
-        entry = {
-            "collected_at": timestamp_str,
+    # Simulate base commit counts (random fluctuation)
+    # BTC/ETH are usually higher, others are lower
+    base_activity = rng.integers(0, 16 if symbol in ["BTC", "ETH"] else 6, PERIODS, dtype=np.int32)
+    
+    # Occasional bursts (Merge Request merges)
+    bursts = rng.random(PERIODS) > 0.9
+    base_activity += np.where(bursts, rng.integers(10, 31, PERIODS, dtype=np.int32), 0)
+    
+    # Simulate core developer ratio (usually a small fraction of total commits)
+    core_dev_counts = (base_activity * rng.uniform(0.2, 0.6, PERIODS)).astype(np.int32)
+    active_repos = rng.integers(1, 6, PERIODS, dtype=np.int32)
+    # Short commit hashes as random 32-bit values (rendered as 8 hex chars)
+    commit_hashes = rng.integers(0, 2**32, PERIODS, dtype=np.uint32)
+    
+    # Timestamps for all periods in one vectorized datetime64 computation
+    timestamps = np.datetime_as_string(np.datetime64(now, 's') - np.arange(PERIODS) * np.timedelta64(30, 'm'), unit='s')
+    
+    # Sort by time in ascending order (Old -> New)
+    return {
+        "collected_at": timestamps[::-1],
+        "total_commits": base_activity[::-1],
+        "core_contributors_commits": core_dev_counts[::-1],
+        "active_repos": active_repos[::-1],
+        "latest_commit_hash": commit_hashes[::-1],
+    }
+
+def to_entries(columns):
+    """Zip column arrays back into the legacy per-period scraper records."""
+    rows = zip(
+        columns["collected_at"].tolist(),
+        columns["total_commits"].tolist(),
+        columns["core_contributors_commits"].tolist(),
+        columns["active_repos"].tolist(),
+        columns["latest_commit_hash"].tolist(),
+    )
+    # Construct records similar to an API response
+    return [
+        {
+            "collected_at": timestamp + "Z",
             "repo_stats": {
-                "total_commits": base_activity,
-                "core_contributors_commits": core_dev_count,
+                "total_commits": commits,
+                "core_contributors_commits": core_commits,
                 # Add some "noise" data to make it look like raw scraper data
-                "active_repos": random.randint(1, 5),
-                "unique_authors": max(1, int(base_activity / 2)) if base_activity > 0 else 0,
-                "latest_commit_hash": str(uuid.uuid4())[:8] if base_activity > 0 else None
+                "active_repos": repos,
+                "unique_authors": max(1, int(commits / 2)) if commits > 0 else 0,
+                "latest_commit_hash": f"{commit_hash:08x}" if commits > 0 else None
             }
         }
-        raw_data_entries.append(entry)
-    
-    # Sort by time in ascending order (Old -> New)
-    raw_data_entries.reverse()
-    
+        for timestamp, commits, core_commits, repos, commit_hash in rows
+    ]
+
+def generate_scraped_data(symbol):
+    """Simulated scraper dataset for `symbol` in the legacy nested JSON layout."""
     # Construct the final JSON structure
     final_json = {
         "symbol": symbol,
@@ -61,30 +98,51 @@ def generate_scraped_data(symbol):
             "period": "24h",
             "granularity": "30min"
         },
-        "activity_log": raw_data_entries
+        "activity_log": to_entries(generate_scraped_columns(symbol))
     }
     
     return final_json
 
+def _output_dir():
+    # Construct path: ./CODE_GEN/developer
+    return os.path.abspath(os.path.join(".", "CODE_GEN", "developer"))
+
+def ensure_output_dir():
+    base_dir = _output_dir()
+    os.makedirs(base_dir, exist_ok=True)
+    return base_dir
+
+def render_raw_file(symbol, data):
+    """Return (file_path, encoded JSON bytes) for a symbol's dataset without touching the disk."""
+    file_path = os.path.join(_output_dir(), f"{symbol}.txt")
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(data, indent=2).encode("utf-8")
+    return file_path, body
+
+def _write_payload(payload):
+    # Unbuffered: hand the whole encoded document to the kernel in one write() call
+    file_path, body = payload
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(body)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return file_path
+
 def save_raw_file(symbol, data):
-    # 1. Build path
-    # Use os.path.abspath to ensure correct path resolution
-    base_dir = os.path.abspath(os.path.join(".", "CODE_GEN", "developer"))
-    
-    if not os.path.exists(base_dir):
-        print(f"Creating directory: {base_dir}")
-        os.makedirs(base_dir)
-        
-    file_path = os.path.join(base_dir, f"{symbol}.txt")
-    
-    # 2. Write JSON
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-        
+    """Write a symbol's dataset; the caller runs ensure_output_dir() once beforehand."""
+    file_path = _write_payload(render_raw_file(symbol, data))
     print(f"✅ [Scraper Mock] Saved raw data for {symbol} to {file_path}")
 
 if __name__ == "__main__":
     print("--- Starting Mock Scraper (Last 24h) ---")
-    for sym in TARGET_SYMBOLS:
-        raw_json = generate_scraped_data(sym)
-        save_raw_file(sym, raw_json)
\ No newline at end of file
+    # Generate and encode everything first, then write all files as one batch
+    payloads = [render_raw_file(sym, generate_scraped_data(sym)) for sym in TARGET_SYMBOLS]
+    ensure_output_dir()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for sym, file_path in zip(TARGET_SYMBOLS, executor.map(_write_payload, payloads)):
+            print(f"✅ [Scraper Mock] Saved raw data for {sym} to {file_path}")
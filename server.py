@@ -1,7 +1,16 @@
+import asyncio
 import json
 import logging
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import List, Tuple, Optional
+import threading
+import time
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Dict, List, Tuple, Optional
+
+try:  # optional faster JSON encoder
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 try:
     from service import db_service
@@ -11,6 +20,12 @@ except Exception as e:  # pragma: no cover
 
 HOST: str = "0.0.0.0"
 PORT: int = 8000
+SERVER_VERSION: str = "AdviceServer/1.0"
+
+# Serialized /api/get_last_10_advises body is reused for this many seconds
+ADVISES_CACHE_TTL: float = 1.0
+_advises_cache = {"body": b"", "ts": float("-inf")}
+_advises_lock = threading.Lock()
 
 
 def cors_headers(origin: Optional[str], request_headers: Optional[str]) -> List[Tuple[str, str]]:
@@ -42,68 +57,164 @@ def cors_headers(origin: Optional[str], request_headers: Optional[str]) -> List[
     return headers
 
 
-class Handler(BaseHTTPRequestHandler):
-    server_version = "AdviceServer/1.0"
+def _format_headers(headers: List[Tuple[str, str]]) -> bytes:
+    """Render header pairs as one raw `Name: value\r\n` block."""
+    return "".join(f"{k}: {v}\r\n" for k, v in headers).encode("latin-1", "strict")
+
+
+# CORS block for requests without Origin / Access-Control-Request-Headers is
+# identical every time, so it is rendered once at import.
+_STATIC_CORS_BLOCK: bytes = _format_headers(cors_headers(None, None))
+_NO_STORE_BLOCK: bytes = b"Cache-Control: no-store\r\n"
 
-    def log_message(self, format: str, *args) -> None:  # noqa: A003
-        logging.info("%s - - %s", self.address_string(), format % args)
 
-    def _write_headers(self, status: int = 200, content_type: str = "application/json; charset=utf-8") -> None:
-        self.send_response(status)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Cache-Control", "no-store")
-        # Add CORS headers based on incoming request
-        origin = self.headers.get("Origin")
-        req_headers = self.headers.get("Access-Control-Request-Headers")
-        for k, v in cors_headers(origin, req_headers):
-            self.send_header(k, v)
-        self.end_headers()
+def _dumps(obj) -> bytes:
+    """Encode to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-    def do_HEAD(self) -> None:  # noqa: N802
-        # Gracefully respond to HEAD with CORS headers
-        self._write_headers(status=200)
 
-    def do_OPTIONS(self) -> None:  # noqa: N802
-        # Respond to CORS preflight
-        self._write_headers(status=204, content_type="text/plain")
+# Static error payloads, encoded once
+_NOT_FOUND_BODY: bytes = json.dumps(
+    {"error": "not_found", "message": "unknown path"}, ensure_ascii=False
+).encode("utf-8")
+_INTERNAL_ERROR_BODY: bytes = json.dumps(
+    {"error": "internal_error", "message": "unexpected database error"}, ensure_ascii=False
+).encode("utf-8")
 
-    def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/api/get_last_10_advises":
-            self._handle_get_last_10_advises()
-            return
 
-        self._write_headers(status=404)
-        body = json.dumps({"error": "not_found", "message": "unknown path"}, ensure_ascii=False)
-        self.wfile.write(body.encode("utf-8"))
+def _last_10_advises_body() -> bytes:
+    """Return the encoded last-10-advises payload, refreshed at most once per TTL.
 
-    def _handle_get_last_10_advises(self) -> None:
+    Concurrent requests that miss the cache wait on one lock so only a single
+    worker thread queries the database and re-encodes the response.
+    """
+    if time.monotonic() - _advises_cache["ts"] < ADVISES_CACHE_TTL:
+        return _advises_cache["body"]
+    with _advises_lock:
+        if time.monotonic() - _advises_cache["ts"] < ADVISES_CACHE_TTL:
+            return _advises_cache["body"]
+        # Rows arrive newest first: the query orders by created_at (or predicted_at) DESC, id DESC
+        body = _dumps(db_service.get_last_10_advises())
+        _advises_cache["body"] = body
+        _advises_cache["ts"] = time.monotonic()
+        return body
+
+
+def _response_head(
+    status: int,
+    request_headers: Dict[str, str],
+    content_type: str = "application/json; charset=utf-8",
+    content_length: Optional[int] = None,
+) -> bytes:
+    """Render the status line and all response headers as one bytes block."""
+    # Add CORS headers based on incoming request
+    origin = request_headers.get("origin")
+    req_headers = request_headers.get("access-control-request-headers")
+    if origin or req_headers:
+        cors = _format_headers(cors_headers(origin, req_headers))
+    else:
+        cors = _STATIC_CORS_BLOCK
+    try:
+        phrase = HTTPStatus(status).phrase
+    except ValueError:
+        phrase = ""
+    head = (
+        f"HTTP/1.0 {status} {phrase}\r\n"
+        f"Server: {SERVER_VERSION}\r\n"
+        f"Date: {formatdate(usegmt=True)}\r\n"
+        f"Content-Type: {content_type}\r\n"
+    ).encode("latin-1", "strict")
+    if content_length is not None:
+        head += b"Content-Length: %d\r\n" % content_length
+    return head + _NO_STORE_BLOCK + cors + b"\r\n"
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    """Parse the request line and headers; return None on a malformed request."""
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        return None
+    lines = raw.decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) < 2:
+        return None
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return parts[0].upper(), parts[1], headers
+
+
+async def _get_last_10_advises(headers: Dict[str, str]) -> Tuple[int, bytes]:
+    try:
+        if time.monotonic() - _advises_cache["ts"] < ADVISES_CACHE_TTL:
+            body = _advises_cache["body"]
+        else:
+            # SQLite access is blocking; keep it off the event loop
+            body = await asyncio.to_thread(_last_10_advises_body)
+        return 200, _response_head(200, headers, content_length=len(body)) + body
+    except Exception as e:
+        logging.exception("Failed to fetch advises: %s", e)
+        return 500, _response_head(500, headers) + _INTERNAL_ERROR_BODY
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve one HTTP/1.0 request on the connection, then close it."""
+    peer = writer.get_extra_info("peername")
+    try:
+        request = await _read_request(reader)
+        if request is None:
+            status = 400
+            writer.write(_response_head(status, {}, content_type="text/plain"))
+            method, path = "-", "-"
+        else:
+            method, path, headers = request
+            if method == "HEAD":
+                # Gracefully respond to HEAD with CORS headers
+                status = 200
+                writer.write(_response_head(status, headers))
+            elif method == "OPTIONS":
+                # Respond to CORS preflight
+                status = 204
+                writer.write(_response_head(status, headers, content_type="text/plain"))
+            elif method == "GET" and path == "/api/get_last_10_advises":
+                status, response = await _get_last_10_advises(headers)
+                writer.write(response)
+            elif method == "GET":
+                status = 404
+                writer.write(_response_head(status, headers) + _NOT_FOUND_BODY)
+            else:
+                status = 501
+                writer.write(_response_head(status, headers, content_type="text/plain"))
+        logging.info("%s - - \"%s %s\" %d", peer[0] if peer else "-", method, path, status)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
         try:
-            items = db_service.get_last_10_advises()
-            # Ensure newest first by created_at as a safety net
-            try:
-                items.sort(key=lambda x: x.get("created_at", x.get("predicted_at", 0)), reverse=True)
-            except Exception:
-                pass
-            body = json.dumps(items, ensure_ascii=False)
-            self._write_headers(status=200)
-            self.wfile.write(body.encode("utf-8"))
-        except Exception as e:
-            logging.exception("Failed to fetch advises: %s", e)
-            self._write_headers(status=500)
-            body = json.dumps({"error": "internal_error", "message": "unexpected database error"}, ensure_ascii=False)
-            self.wfile.write(body.encode("utf-8"))
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve() -> None:
+    server = await asyncio.start_server(handle_connection, HOST, PORT)
+    logging.info("Server running at http://%s:%d", HOST, PORT)
+    async with server:
+        await server.serve_forever()
 
 
 def run() -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-    server = ThreadingHTTPServer((HOST, PORT), Handler)
-    logging.info("Server running at http://%s:%d", HOST, PORT)
     try:
-        server.serve_forever()
+        asyncio.run(serve())
     except KeyboardInterrupt:  # pragma: no cover
         logging.info("Shutting down...")
-    finally:
-        server.server_close()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Awaitable, Dict, Any, List, Optional, Sequence, Tuple
 import asyncio
+import functools
 import json
 import math
-import statistics
 import os
+import weakref
+
+import numpy as np
 
 try:
     # spoon-toolkits provides CEX market data access
@@ -16,6 +19,12 @@ except Exception:
     get_cex_data_with_indicators = None  # type: ignore
 
 
+try:  # optional faster JSON encoder
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
 # Optional async CCXT fallback for real CEX calls when spoon_toolkits is missing
 try:  # pragma: no cover - optional dependency
     import ccxt.async_support as ccxt_async  # type: ignore
@@ -23,6 +32,209 @@ except Exception:  # pragma: no cover - optional dependency
     ccxt_async = None  # type: ignore
 
 
+# Optional Numba JIT for the 24h statistics kernel
+try:  # pragma: no cover - optional dependency
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore
+
+
+def _compute_stats_np(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray
+) -> Tuple[float, float, float, float, float, float, float, float]:
+    """
+    24h statistics over per-bar float64 arrays where NaN marks a missing value.
+
+    Returns (high, low, volume, quote_volume, twap, median_close, stddev_close,
+    avg_true_range); NaN means "not available". Volumes must already have
+    missing values replaced with 0.
+    """
+    nan = math.nan
+    valid_h = highs[~np.isnan(highs)]
+    valid_l = lows[~np.isnan(lows)]
+    valid_c = ~np.isnan(closes)
+    c = closes[valid_c]
+    high = float(valid_h.max()) if valid_h.size else nan
+    low = float(valid_l.min()) if valid_l.size else nan
+    volume = float(volumes.sum())
+    # Sum of close*volume, computed once and reused for both VWAP and quote volume
+    quote_volume = float(np.dot(c, volumes[valid_c]))
+    twap = median = std = nan
+    if c.size:
+        twap = float(c.mean())
+        median = float(np.median(c))
+        std = float(c.std())  # population std (ddof=0)
+
+    # True Range over bars with both high and low: max(H-L, |H-prevC|, |prevC-L|),
+    # or plain H-L where the current or previous close is missing (NaN is ignored by fmax).
+    atr = nan
+    has_hl = ~(np.isnan(highs) | np.isnan(lows))
+    if has_hl.any():
+        h = highs[has_hl]
+        l = lows[has_hl]
+        tr_closes = closes[has_hl]
+        prev_closes = np.empty_like(tr_closes)
+        prev_closes[0] = nan
+        prev_closes[1:] = tr_closes[:-1]
+        prev_closes[np.isnan(tr_closes)] = nan
+        true_ranges = np.fmax.reduce([h - l, np.abs(h - prev_closes), np.abs(prev_closes - l)])
+        atr = float(true_ranges.mean())
+    return high, low, volume, quote_volume, twap, median, std, atr
+
+
+def _compute_stats_loop(highs, lows, closes, volumes):  # pragma: no cover - compiled by numba
+    """Single-loop equivalent of `_compute_stats_np`, compiled when numba is installed."""
+    nan = np.nan
+    high = nan
+    low = nan
+    volume = 0.0
+    quote_volume = 0.0
+    close_sum = 0.0
+    n_closes = 0
+    tr_sum = 0.0
+    n_tr = 0
+    prev_close = nan
+    for i in range(highs.shape[0]):
+        h = highs[i]
+        l = lows[i]
+        c = closes[i]
+        v = volumes[i]
+        if not np.isnan(h) and (np.isnan(high) or h > high):
+            high = h
+        if not np.isnan(l) and (np.isnan(low) or l < low):
+            low = l
+        volume += v
+        if not np.isnan(c):
+            close_sum += c
+            n_closes += 1
+            quote_volume += c * v
+        if not np.isnan(h) and not np.isnan(l):
+            tr = h - l
+            if not np.isnan(prev_close) and not np.isnan(c):
+                tr = max(tr, abs(h - prev_close), abs(prev_close - l))
+            tr_sum += tr
+            n_tr += 1
+            prev_close = c
+
+    twap = nan
+    median = nan
+    std = nan
+    if n_closes > 0:
+        twap = close_sum / n_closes
+        valid = closes[~np.isnan(closes)]
+        median = np.median(valid)
+        sq = 0.0
+        for x in valid:
+            sq += (x - twap) * (x - twap)
+        std = np.sqrt(sq / n_closes)
+    atr = tr_sum / n_tr if n_tr > 0 else nan
+    return high, low, volume, quote_volume, twap, median, std, atr
+
+
+_compute_stats = _compute_stats_np
+if njit is not None:
+    try:
+        # Eager compile for the one signature used; fastmath stays off because the
+        # kernel relies on NaN checks to mark missing values.
+        _compute_stats = njit(
+            "UniTuple(float64, 8)(float64[::1], float64[::1], float64[::1], float64[::1])",
+            cache=True,
+        )(_compute_stats_loop)
+    except Exception:  # pragma: no cover - e.g. unreadable JIT cache; keep the NumPy path
+        _compute_stats = _compute_stats_np
+
+
+_SOA_FIELDS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+
+def _drop_none_fields(bars: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Remove None values from each bar at ingestion to avoid collecting empty fields."""
+    return [{k: v for k, v in b.items() if v is not None} for b in bars]
+
+
+def _bars_to_soa(bars: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert list-of-dict bars into contiguous float64 column arrays, one per OHLCV
+    field, in a single pass. Missing prices become NaN; missing volume becomes 0.
+    """
+    n_bars = len(bars)
+    opens = np.empty(n_bars, dtype=np.float64)
+    highs = np.empty(n_bars, dtype=np.float64)
+    lows = np.empty(n_bars, dtype=np.float64)
+    closes = np.empty(n_bars, dtype=np.float64)
+    volumes = np.empty(n_bars, dtype=np.float64)
+    nan = math.nan
+    for i, b in enumerate(bars):
+        get = b.get  # bound once per bar
+        o = get("open")
+        h = get("high")
+        l = get("low")
+        c = get("close")
+        opens[i] = o if o is not None else nan
+        highs[i] = h if h is not None else nan
+        lows[i] = l if l is not None else nan
+        closes[i] = c if c is not None else nan
+        volumes[i] = get("volume") or 0.0
+    return dict(zip(_SOA_FIELDS, (opens, highs, lows, closes, volumes)))
+
+
+# ccxt async clients are bound to the event loop that created them, so reused
+# instances are cached per loop and keyed by exchange name.
+_EXCHANGE_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_EXCHANGE_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+async def _get_exchange(exchange: str) -> Any:
+    """
+    Return a ccxt async client for `exchange` with markets already loaded.
+
+    The client is created and `load_markets()` is called once per event loop;
+    later fetches reuse it. Call `close_exchanges()` before the loop ends.
+    """
+    if ccxt_async is None:
+        raise RuntimeError("ccxt is not available for real-data fallback")
+
+    loop = asyncio.get_running_loop()
+    cache = _EXCHANGE_CACHE.setdefault(loop, {})
+    ex = cache.get(exchange)
+    if ex is not None:
+        return ex
+
+    async with _EXCHANGE_LOCKS.setdefault(loop, asyncio.Lock()):
+        ex = cache.get(exchange)
+        if ex is None:
+            ex_class = getattr(ccxt_async, exchange, None)
+            if ex_class is None:
+                raise ValueError(f"Unsupported exchange: {exchange}")
+            # ccxt's built-in throttle paces the concurrent fetch_ohlcv calls
+            ex = ex_class({"enableRateLimit": True})
+            try:
+                await ex.load_markets()
+            except Exception:
+                await ex.close()
+                raise
+            cache[exchange] = ex
+    return ex
+
+
+async def close_exchanges() -> None:
+    """Close every cached ccxt client created on the running event loop."""
+    cache = _EXCHANGE_CACHE.pop(asyncio.get_running_loop(), {})
+    for ex in cache.values():
+        try:
+            await ex.close()
+        except Exception:
+            pass
+
+
+async def _closing_exchanges(coro: Awaitable[Any]) -> Any:
+    """Await `coro`, then release the cached exchange clients of this loop."""
+    try:
+        return await coro
+    finally:
+        await close_exchanges()
+
+
 async def _fetch_bars_ccxt(
     symbol: str,
     exchange: str,
@@ -36,66 +248,82 @@ async def _fetch_bars_ccxt(
     Returns a tuple of (bars, resolved_pair). Each bar is a dict with
     keys: timestamp, open, high, low, close, volume.
     """
-    if ccxt_async is None:
-        raise RuntimeError("ccxt is not available for real-data fallback")
+    ex = await _get_exchange(exchange)
+
+    # Resolve market symbol considering exchange-specific naming (e.g., Kraken XBT)
+    preferred = f"{symbol}/{quote}"
+    market_symbol: Optional[str] = preferred if preferred in ex.markets else None
+
+    if market_symbol is None:
+        alt_bases = [symbol]
+        if symbol.upper() == "BTC":
+            alt_bases.append("XBT")  # Kraken naming
+        alt_quotes = [quote, "USDT", "USD", "USDC", "EUR"]
+        for b in alt_bases:
+            for q in alt_quotes:
+                cand = f"{b}/{q}"
+                if cand in ex.markets:
+                    market_symbol = cand
+                    break
+            if market_symbol is not None:
+                break
+
+    if market_symbol is None:
+        raise ValueError(f"No market found for {symbol} on {exchange}")
+
+    ohlcv = await ex.fetch_ohlcv(market_symbol, timeframe=timeframe, limit=limit)
+    if not ohlcv:
+        return [], market_symbol
+
+    # ccxt format: [timestamp, open, high, low, close, volume]. Convert all rows
+    # to float64 in one C-level pass; None becomes NaN.
+    # Missing (NaN) fields are left out of the bar dict altogether.
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    bars: List[Dict[str, Any]] = []
+    for row in arr.tolist():
+        bar: Dict[str, Any] = {"timestamp": int(row[0])}
+        for key, value in zip(_SOA_FIELDS, row[1:]):
+            if value == value:
+                bar[key] = value
+        bars.append(bar)
+
+    return bars, market_symbol
+
+
+# Richer indicator config to return more data in each bar; serialized once
+_INDICATORS_CONFIG = json.dumps(
+    {
+        "ema": [{"timeperiod": 12}, {"timeperiod": 26}],
+        "sma": [{"timeperiod": 20}],
+        "rsi": [{"timeperiod": 14}],
+        "macd": [{"fastperiod": 12, "slowperiod": 26, "signalperiod": 9}],
+        "atr": [{"timeperiod": 14}],
+        "bbands": [{"timeperiod": 20, "nbdevup": 2, "nbdevdn": 2}],
+        # Remove unsupported STOCH parameters to avoid warnings; use defaults
+        "stoch": [{}],
+        "adx": [{"timeperiod": 14}],
+        "cci": [{"timeperiod": 14}],
+        "obv": [{}],
+    }
+)
 
-    ex_class = getattr(ccxt_async, exchange, None)
-    if ex_class is None:
-        raise ValueError(f"Unsupported exchange: {exchange}")
 
-    ex = ex_class()
-    try:
-        await ex.load_markets()
-
-        # Resolve market symbol considering exchange-specific naming (e.g., Kraken XBT)
-        preferred = f"{symbol}/{quote}"
-        market_symbol: Optional[str] = preferred if preferred in ex.markets else None
-
-        if market_symbol is None:
-            alt_bases = [symbol]
-            if symbol.upper() == "BTC":
-                alt_bases.append("XBT")  # Kraken naming
-            alt_quotes = [quote, "USDT", "USD", "USDC", "EUR"]
-            for b in alt_bases:
-                for q in alt_quotes:
-                    cand = f"{b}/{q}"
-                    if cand in ex.markets:
-                        market_symbol = cand
-                        break
-                if market_symbol is not None:
-                    break
+@functools.lru_cache(maxsize=1)
+def _get_cex_tool() -> Any:
+    """Return a shared CryptoPowerDataCEXTool instance, or None if unavailable."""
+    if CryptoPowerDataCEXTool is None:
+        return None
+    return CryptoPowerDataCEXTool()
 
-        if market_symbol is None:
-            raise ValueError(f"No market found for {symbol} on {exchange}")
-
-        ohlcv = await ex.fetch_ohlcv(market_symbol, timeframe=timeframe, limit=limit)
-        bars: List[Dict[str, Any]] = []
-        for item in ohlcv:
-            # ccxt format: [timestamp, open, high, low, close, volume]
-            ts, o, h, l, c, v = item
-            bars.append(
-                {
-                    "timestamp": ts,
-                    "open": float(o) if o is not None else None,
-                    "high": float(h) if h is not None else None,
-                    "low": float(l) if l is not None else None,
-                    "close": float(c) if c is not None else None,
-                    "volume": float(v) if v is not None else None,
-                }
-            )
-
-        return bars, market_symbol
-    finally:  # ensure proper cleanup of exchange resources
-        try:
-            await ex.close()
-        except Exception:
-            pass
 
+@functools.lru_cache(maxsize=1)
+def get_tracking_cryptocurrencies() -> Tuple[str, ...]:
+    """Return the ten most active cryptocurrencies as hardcoded symbols.
 
-def get_tracking_cryptocurrenc() -> List[str]:
-    """Return the ten most active cryptocurrencies as hardcoded symbols."""
+    The result is an immutable tuple built once and shared by all callers.
+    """
 
-    return [
+    return (
         "USDT",
         "BTC",
         "ETH",
@@ -104,8 +332,12 @@ def get_tracking_cryptocurrenc() -> List[str]:
         "XRP",
         "ZEC",
         "BNB",
-        "DOGE"
-    ]
+        "DOGE",
+    )
+
+
+# Backwards-compatible alias for the original (misspelled) name
+get_tracking_cryptocurrenc = get_tracking_cryptocurrencies
 
 
 async def async_get_symbol_24h_data(
@@ -138,23 +370,6 @@ async def async_get_symbol_24h_data(
     # Ensure we always perform real calls: use spoon_toolkits if available,
     # otherwise fall back to ccxt async. No mock or empty data.
 
-    # Include richer indicator config to return more data in each bar
-    indicators_config = json.dumps(
-        {
-            "ema": [{"timeperiod": 12}, {"timeperiod": 26}],
-            "sma": [{"timeperiod": 20}],
-            "rsi": [{"timeperiod": 14}],
-            "macd": [{"fastperiod": 12, "slowperiod": 26, "signalperiod": 9}],
-            "atr": [{"timeperiod": 14}],
-            "bbands": [{"timeperiod": 20, "nbdevup": 2, "nbdevdn": 2}],
-            # Remove unsupported STOCH parameters to avoid warnings; use defaults
-            "stoch": [{}],
-            "adx": [{"timeperiod": 14}],
-            "cci": [{"timeperiod": 14}],
-            "obv": [{}],
-        }
-    )
-
     resolved_pair = f"{symbol}/{quote}"
     bars: List[Dict[str, Any]]
 
@@ -165,60 +380,68 @@ async def async_get_symbol_24h_data(
             symbol=resolved_pair,
             timeframe=timeframe,
             limit=24,
-            indicators_config=indicators_config,
+            indicators_config=_INDICATORS_CONFIG,
             use_enhanced=True,
         )
         if not result.get("success"):
             # Fall back to ccxt if the tool function fails
             bars, resolved_pair = await _fetch_bars_ccxt(symbol, exchange, quote, timeframe, 24)
         else:
-            bars = result.get("data", [])
-    elif CryptoPowerDataCEXTool is not None:
-        tool = CryptoPowerDataCEXTool()
-        tool_result = await tool.execute(
+            bars = _drop_none_fields(result.get("data", []))
+    elif _get_cex_tool() is not None:
+        tool_result = await _get_cex_tool().execute(
             exchange=exchange,
             symbol=resolved_pair,
             timeframe=timeframe,
             limit=24,
             use_enhanced=True,
-            indicators_config=indicators_config,
+            indicators_config=_INDICATORS_CONFIG,
         )
         if getattr(tool_result, "error", None):
             # Fall back to ccxt if the toolkit class call fails
             bars, resolved_pair = await _fetch_bars_ccxt(symbol, exchange, quote, timeframe, 24)
         else:
-            bars = tool_result.output or []
+            bars = _drop_none_fields(tool_result.output or [])
     else:
         # Spoon not available: use ccxt for real CEX data
         bars, resolved_pair = await _fetch_bars_ccxt(symbol, exchange, quote, timeframe, 24)
 
-    # Compute 24h aggregates
-    open_24h = bars[0].get("open") if bars else None
-    close_latest = bars[-1].get("close") if bars else None
-    high_24h = max((b.get("high") for b in bars), default=None) if bars else None
-    low_24h = min((b.get("low") for b in bars), default=None) if bars else None
-    volume_24h = sum((b.get("volume") or 0.0 for b in bars)) if bars else None
+    if not bars:
+        # Nothing to aggregate; keep the payload shape with empty sections
+        return {
+            "pair": resolved_pair,
+            "exchange": exchange,
+            "timeframe": timeframe,
+            "bars": [],
+            "stats": {},
+            "indicators_latest": {},
+        }
+
+    # Compute 24h aggregates over column arrays of the bars (non-empty from here on)
+    open_24h = bars[0].get("open")
+    close_latest = bars[-1].get("close")
+    cols = _bars_to_soa(bars)
+
+    (
+        high_24h,
+        low_24h,
+        volume_24h,
+        quote_volume_sum,
+        twap_24h,
+        median_close_24h,
+        stddev_close_24h,
+        avg_true_range_24h,
+    ) = (
+        None if math.isnan(x) else float(x)
+        for x in _compute_stats(cols["high"], cols["low"], cols["close"], cols["volume"])
+    )
 
     # Additional aggregates
-    closes = [b.get("close") for b in bars if b.get("close") is not None]
     vwap_24h = None
-    twap_24h = None
-    median_close_24h = None
-    stddev_close_24h = None
     quote_volume_24h = None
-    if bars and volume_24h and volume_24h > 0:
-        vwap_24h = sum((b.get("close", 0.0) * (b.get("volume") or 0.0) for b in bars)) / volume_24h
-        quote_volume_24h = sum((b.get("close", 0.0) * (b.get("volume") or 0.0) for b in bars))
-    if closes:
-        twap_24h = sum(closes) / len(closes)
-        try:
-            median_close_24h = statistics.median(closes)
-        except statistics.StatisticsError:
-            median_close_24h = None
-        try:
-            stddev_close_24h = statistics.pstdev(closes)
-        except statistics.StatisticsError:
-            stddev_close_24h = None
+    if volume_24h and volume_24h > 0:
+        vwap_24h = quote_volume_sum / volume_24h
+        quote_volume_24h = quote_volume_sum
 
     change_24h_abs = None
     change_24h_percent = None
@@ -231,45 +454,18 @@ async def async_get_symbol_24h_data(
         except Exception:
             log_return_24h_percent = None
 
-    # True Range and volatility metrics across the window
-    true_ranges: List[float] = []
-    prev_close = None
-    for b in bars:
-        h = b.get("high")
-        l = b.get("low")
-        c = b.get("close")
-        if h is None or l is None:
-            continue
-        if prev_close is None or c is None:
-            tr = (h - l) if (h is not None and l is not None) else None
-        else:
-            tr = max(h - l, abs(h - prev_close), abs(prev_close - l))
-        if tr is not None:
-            true_ranges.append(tr)
-        prev_close = c
-
-    avg_true_range_24h = (sum(true_ranges) / len(true_ranges)) if true_ranges else None
-
     # Latest indicator snapshot (everything beyond core OHLCV)
-    indicators_latest: Dict[str, Any] = {}
-    if bars:
-        latest = dict(bars[-1])
-        for k, v in list(latest.items()):
-            if k in {"timestamp", "open", "high", "low", "close", "volume"}:
-                continue
-            if v is not None:
-                indicators_latest[k] = v
-
-    # Remove None values from each bar to avoid collecting empty fields
-    clean_bars: List[Dict[str, Any]] = []
-    for b in bars:
-        clean_bars.append({k: v for k, v in b.items() if v is not None})
+    indicators_latest: Dict[str, Any] = {
+        k: v
+        for k, v in bars[-1].items()
+        if k not in {"timestamp", "open", "high", "low", "close", "volume"}
+    }
 
     result_payload = {
         "pair": resolved_pair,
         "exchange": exchange,
         "timeframe": timeframe,
-        "bars": clean_bars,
+        "bars": bars,
         "stats": {
             "open_24h": open_24h,
             "close_latest": close_latest,
@@ -319,48 +515,123 @@ def get_symbol_24h_data(
             "get_symbol_24h_data() called in a running event loop. "
             "Use await async_get_symbol_24h_data(...) instead."
         )
-    return asyncio.run(async_get_symbol_24h_data(symbol, exchange, quote, timeframe))
+    return asyncio.run(
+        _closing_exchanges(async_get_symbol_24h_data(symbol, exchange, quote, timeframe))
+    )
+
+
+async def _fetch_bounded(
+    semaphore: asyncio.Semaphore,
+    symbol: str,
+    exchange: str,
+    quote: str,
+    timeframe: str,
+) -> Dict[str, Any]:
+    async with semaphore:
+        return await async_get_symbol_24h_data(symbol, exchange, quote, timeframe)
 
 
+async def fetch_all(
+    symbols: Sequence[str],
+    exchange: str = "kraken",
+    quote: str = "USD",
+    timeframe: str = "1h",
+    max_concurrency: int = 5,
+) -> List[Any]:
+    """
+    Fetch 24h data for all `symbols` concurrently inside one event loop.
 
-def save_tracking_symbols_to_resources(
+    At most `max_concurrency` requests are in flight at once to stay within
+    exchange rate limits. Results are returned in the order of `symbols`. A
+    failed fetch yields the raised exception in its slot instead of aborting
+    the whole batch.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(
+        *(_fetch_bounded(semaphore, symbol, exchange, quote, timeframe) for symbol in symbols),
+        return_exceptions=True,
+    )
+
+
+def _encode_resource(data: Dict[str, Any]) -> bytes:
+    """Encode a symbol dataset as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_resource(file_path: str, data: Dict[str, Any]) -> None:
+    with open(file_path, "wb") as f:
+        f.write(_encode_resource(data))
+
+
+async def async_save_tracking_symbols_to_resources(
     exchange: str = "kraken",
     quote: str = "USD",
     timeframe: str = "1h",
     output_dir: str = "CODE_GEN/resources",
-    symbols: Optional[List[str]] = None,
+    symbols: Optional[Sequence[str]] = None,
+    max_concurrency: int = 5,
 ) -> Dict[str, str]:
     """
     Fetch data for provided `symbols` if given; otherwise use
-    `get_tracking_cryptocurrenc()` defaults. Save each symbol's dataset into
+    `get_tracking_cryptocurrencies()` defaults. Save each symbol's dataset into
     `CODE_GEN/resources/{symbol}.txt`.
 
+    All symbols are fetched concurrently (at most `max_concurrency` at once); each
+    file is encoded and written as soon as its own fetch completes.
+
     Returns a mapping of `symbol -> file_path` for successfully written files.
     """
 
     os.makedirs(output_dir, exist_ok=True)
-    written: Dict[str, str] = {}
 
-    iteration_symbols = symbols if symbols else get_tracking_cryptocurrenc()
+    iteration_symbols = symbols if symbols else get_tracking_cryptocurrencies()
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    for symbol in iteration_symbols:
-        try:
-            data = get_symbol_24h_data(
-                symbol=symbol,
-                exchange=exchange,
-                quote=quote,
-                timeframe=timeframe,
-            )
-            file_path = os.path.join(output_dir, f"{symbol}.txt")
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(data, ensure_ascii=False, indent=2))
-            written[symbol] = file_path
-        except Exception as e:
-            # Continue on error; do not raise to allow other symbols to be saved
-            # You can inspect the error externally if needed.
-            continue
-
-    return written
+    async def _fetch_and_save(symbol: str) -> str:
+        data = await _fetch_bounded(semaphore, symbol, exchange, quote, timeframe)
+        file_path = os.path.join(output_dir, f"{symbol}.txt")
+        # Encoding and the blocking file write run in a worker thread, overlapping
+        # with the fetches still in flight
+        await asyncio.to_thread(_write_resource, file_path, data)
+        return file_path
+
+    outcomes = await asyncio.gather(
+        *(_fetch_and_save(symbol) for symbol in iteration_symbols), return_exceptions=True
+    )
+
+    # Continue on error; do not raise to allow other symbols to be saved.
+    # You can inspect the error externally if needed.
+    return {
+        symbol: outcome
+        for symbol, outcome in zip(iteration_symbols, outcomes)
+        if not isinstance(outcome, BaseException)
+    }
+
+
+def save_tracking_symbols_to_resources(
+    exchange: str = "kraken",
+    quote: str = "USD",
+    timeframe: str = "1h",
+    output_dir: str = "CODE_GEN/resources",
+    symbols: Optional[Sequence[str]] = None,
+) -> Dict[str, str]:
+    """
+    Sync wrapper for `async_save_tracking_symbols_to_resources`.
+
+    Returns a mapping of `symbol -> file_path` for successfully written files.
+    """
+
+    return asyncio.run(
+        _closing_exchanges(
+            async_save_tracking_symbols_to_resources(exchange, quote, timeframe, output_dir, symbols)
+        )
+    )
 
 if __name__ == "__main__":
     save_tracking_symbols_to_resources()
@@ -1,19 +1,292 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import os
+import queue
 import sqlite3
-from typing import Any, Dict, List
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 DB_PATH = "data.db"
 
+# Optional advises columns, in the order they are selected
+_OPTIONAL_COLS: Tuple[str, ...] = (
+    "price",
+    "change_24h_percent",
+    "sentiment_score",
+    "volume_24h",
+    "market_capacity",
+)
+
+# Reusable read-only connections; LIFO so the most recently used (warmest) one is handed out first.
+# At most one idle connection per CPU is kept; extras opened under load are closed on return.
+_RO_POOL_SIZE = os.cpu_count() or 4
+_RO_POOL: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=_RO_POOL_SIZE)
+
+# Single read-write connection; writers are serialized on the lock (SQLite allows one writer)
+_rw_conn: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+
+_bootstrapped = False
+_bootstrap_lock = threading.Lock()
+
+# SELECT statement built from the advises schema, keyed on (DB_PATH, PRAGMA schema_version)
+_SCHEMA_CACHE: Dict[Tuple[str, int], str] = {}
+
 
 def _connect_readonly() -> sqlite3.Connection:
     """Return a read-only SQLite connection if possible; fall back to rw."""
     try:
         # Use URI to open the database in read-only mode when available
-        return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False)
     except Exception:
         # Fall back to regular connection (e.g., file may not exist yet)
-        return sqlite3.connect(DB_PATH)
+        return sqlite3.connect(DB_PATH, check_same_thread=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _column_names(description: Tuple[Tuple[Any, ...], ...]) -> Tuple[str, ...]:
+    return tuple(d[0] for d in description)
+
+
+def _dict_row_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Build each row directly as a dict, dropping None values to keep payloads clean."""
+    return {c: v for c, v in zip(_column_names(cursor.description), row) if v is not None}
+
+
+def _bootstrap_db() -> None:
+    """
+    One-time database setup: switch `advises` storage to WAL journaling so
+    readers never block the writer (the mode is persisted in the file) and
+    create the index backing the latest-advises query.
+    Runs only on the write path (`write_conn()`, once the writer has opened or
+    created the file), so reads never modify the database. Marked done only
+    once it has completed; until then every write retries it.
+    """
+    global _bootstrapped
+    with _bootstrap_lock:
+        if _bootstrapped or not os.path.exists(DB_PATH):
+            return
+        try:
+            conn = sqlite3.connect(DB_PATH, timeout=5.0)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                # Index matching the latest-10 ORDER BY so the read becomes a
+                # short index scan instead of a full scan + sort
+                cols = {r[1] for r in conn.execute("PRAGMA table_info(advises)")}
+                order_col = "created_at" if "created_at" in cols else "predicted_at"
+                if order_col not in cols:
+                    # No advises table yet: retry on a later write
+                    return
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='index' AND name=?",
+                    (f"idx_advises_recent_{order_col}",),
+                ).fetchone()
+                if exists is None:
+                    conn.execute(
+                        f"CREATE INDEX idx_advises_recent_{order_col} "
+                        f"ON advises({order_col} DESC, id DESC)"
+                    )
+                    conn.execute("ANALYZE advises")
+                    conn.commit()
+                _bootstrapped = True
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+
+def _open_pooled() -> sqlite3.Connection:
+    conn = _connect_readonly()
+    conn.row_factory = _dict_row_factory
+    for pragma in (
+        "PRAGMA query_only=1",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=30000000000",
+    ):
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+    return conn
+
+
+def _release_ro(conn: sqlite3.Connection) -> None:
+    try:
+        _RO_POOL.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def read_conn() -> Iterator[sqlite3.Connection]:
+    """
+    Check a read-only connection out of the pool (opening one if it is empty)
+    and return it afterwards. Rows come back as dicts with None values dropped.
+    Reading has no side effects on the database file (no journal mode or index changes).
+    A connection that raised an unexpected error is closed instead of being returned.
+    """
+    try:
+        conn = _RO_POOL.get_nowait()
+    except queue.Empty:
+        conn = _open_pooled()
+    try:
+        yield conn
+    except sqlite3.OperationalError:
+        _release_ro(conn)
+        raise
+    except BaseException:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        raise
+    else:
+        _release_ro(conn)
+
+
+def _open_writer() -> sqlite3.Connection:
+    # Autocommit mode: write_conn() issues BEGIN IMMEDIATE / COMMIT itself
+    conn = sqlite3.connect(DB_PATH, timeout=5.0, isolation_level=None, check_same_thread=False)
+    for pragma in (
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    ):
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+    return conn
+
+
+@contextmanager
+def write_conn() -> Iterator[sqlite3.Connection]:
+    """
+    Run the block as one write transaction on the shared read-write connection.
+
+    Callers are serialized on a process-wide lock, and the transaction starts
+    with BEGIN IMMEDIATE so the write lock is taken up front rather than on the
+    first write (avoiding a BUSY upgrade failure mid-transaction). Commits on
+    success, rolls back on error.
+    """
+    global _rw_conn
+    with _write_lock:
+        if _rw_conn is None:
+            _rw_conn = _open_writer()
+        if not _bootstrapped:
+            _bootstrap_db()
+        conn = _rw_conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+
+def _reset_after_fork() -> None:
+    """
+    A forked child must not use the parent's SQLite handles: drop them (without
+    closing, which would affect the parent's files) and start with fresh state.
+    """
+    global _RO_POOL, _rw_conn, _write_lock
+    _RO_POOL = queue.LifoQueue(maxsize=_RO_POOL_SIZE)
+    _rw_conn = None
+    _write_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+@atexit.register
+def _drain_pool() -> None:
+    global _rw_conn
+    with _write_lock:
+        if _rw_conn is not None:
+            try:
+                _rw_conn.close()
+            except Exception:
+                pass
+            _rw_conn = None
+    while True:
+        try:
+            conn = _RO_POOL.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _last_10_sql(cur: sqlite3.Cursor) -> str:
+    """
+    Return the SELECT for the latest 10 advises, inspecting the schema only when
+    it has changed since the statement was last built.
+
+    The cache is keyed on PRAGMA schema_version, which SQLite bumps on every
+    schema change (e.g. final_analysis adding the optional columns with ALTER
+    TABLE). Unlike the file mtime it also reflects changes still sitting in
+    the WAL file, so a running server picks up new columns immediately.
+    """
+    try:
+        cur.execute("PRAGMA schema_version")
+        version = cur.fetchone()["schema_version"]
+    except Exception:
+        version = -1
+    key = (DB_PATH, version)
+    sql = _SCHEMA_CACHE.get(key)
+    if sql is not None:
+        return sql
+
+    # Detect available columns to include optional fields
+    col_names: frozenset = frozenset()
+    try:
+        cur.execute("PRAGMA table_info(advises)")
+        col_names = frozenset(r["name"] for r in cur.fetchall())
+    except Exception:
+        # If table doesn't exist yet or PRAGMA fails, fall back gracefully
+        pass
+    present_optionals = [c for c in _OPTIONAL_COLS if c in col_names]
+
+    select_cols = [
+        "symbol",
+        "advice_action",
+        "advice_strength",
+        "reason",
+        "CAST(predicted_at AS INTEGER) AS predicted_at",
+    ]
+    # Include created_at when present to allow clients to consume it
+    has_created_at = "created_at" in col_names
+    if has_created_at:
+        select_cols.append("CAST(created_at AS INTEGER) AS created_at")
+    select_cols.extend(present_optionals)
+
+    # Prefer ordering by created_at when available; else predicted_at. The column
+    # is table-qualified so ORDER BY uses the raw (indexed) column, not the CAST alias.
+    order_col = "advises.created_at" if has_created_at else "advises.predicted_at"
+    sql = (
+        "SELECT "
+        + ",\n              ".join(select_cols)
+        + f"\n            FROM advises\n            ORDER BY {order_col} DESC, id DESC\n            LIMIT 10"
+    )
+    _SCHEMA_CACHE.clear()
+    _SCHEMA_CACHE[key] = sql
+    return sql
 
 
 def get_last_10_advises() -> List[Dict[str, Any]]:
@@ -33,94 +306,16 @@ def get_last_10_advises() -> List[Dict[str, Any]]:
     """
 
     try:
-        conn = _connect_readonly()
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        # Detect available columns to include optional fields
-        optional_cols = {"price", "change_24h_percent", "sentiment_score", "volume_24h", "market_capacity"}
-        present_optionals: List[str] = []
-        try:
-            cur.execute("PRAGMA table_info(advises)")
-            columns_info = cur.fetchall()
-            col_names = {r[1] for r in columns_info}  # type: ignore[index]
-            present_optionals = [c for c in optional_cols if c in col_names]
-        except Exception:
-            # If table doesn't exist yet or PRAGMA fails, fall back gracefully
-            present_optionals = []
-
-        select_cols = [
-            "symbol",
-            "advice_action",
-            "advice_strength",
-            "reason",
-            "CAST(predicted_at AS INTEGER) AS predicted_at",
-        ]
-        # Include created_at when present to allow clients to consume it
-        has_created_at = False
-        try:
-            has_created_at = "created_at" in col_names
-        except Exception:
-            has_created_at = False
-        if has_created_at:
-            select_cols.append("CAST(created_at AS INTEGER) AS created_at")
-        select_cols.extend(present_optionals)
-
-        # Prefer ordering by created_at when available; else predicted_at
-        order_col = "created_at" if has_created_at else "predicted_at"
-        sql = (
-            "SELECT "
-            + ",\n              ".join(select_cols)
-            + f"\n            FROM advises\n            ORDER BY {order_col} DESC, id DESC\n            LIMIT 10"
-        )
-
-        cur.execute(sql)
-        rows = cur.fetchall()
+        with read_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(_last_10_sql(cur))
+            # predicted_at / created_at are already CAST to INTEGER by the query;
+            # the row factory yields the final dicts with None values dropped.
+            # The query is LIMIT 10, so fetch exactly that many rows.
+            results: List[Dict[str, Any]] = cur.fetchmany(10)
     except sqlite3.OperationalError:
         # Table or columns may not exist yet; return empty list gracefully
         return []
-    except Exception:
-        # For unanticipated errors the server layer will decide how to respond
-        raise
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
-
-    results: List[Dict[str, Any]] = []
-    for r in rows:
-        item = {
-            "symbol": r["symbol"],
-            "advice_action": r["advice_action"],
-            "advice_strength": r["advice_strength"],
-            "reason": r["reason"],
-            # Ensure integer for API contract
-            "predicted_at": int(r["predicted_at"]) if r["predicted_at"] is not None else None,
-        }
-        # Include created_at when available
-        try:
-            if "created_at" in r.keys():
-                item["created_at"] = int(r["created_at"]) if r["created_at"] is not None else None
-        except Exception:
-            pass
-        # Optional fields when present in schema
-        try:
-            keys = set(r.keys())
-            if "price" in keys:
-                item["price"] = r["price"]
-            if "change_24h_percent" in keys:
-                item["change_24h_percent"] = r["change_24h_percent"]
-            if "sentiment_score" in keys:
-                item["sentiment_score"] = r["sentiment_score"]
-            if "volume_24h" in keys:
-                item["volume_24h"] = r["volume_24h"]
-            if "market_capacity" in keys:
-                item["market_capacity"] = r["market_capacity"]
-        except Exception:
-            pass
-
-        # Drop None values to keep payload clean
-        results.append({k: v for k, v in item.items() if v is not None})
+    # For unanticipated errors the server layer will decide how to respond
 
     return results
@@ -15,12 +15,14 @@ export OPENAI_MAX_TOKENS="2000"
 python service/social_media_analyzer.py
 """
 
-from openai import OpenAI
 import os
 import json
+import time
+import hashlib
 import logging
-from datetime import datetime
-import PyPDF2
+import sqlite3
+import functools
+from typing import Optional
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +31,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sidecar SQLite cache of analyze_symbols responses, next to data.db in the project root
+LLM_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".llm_cache.db"
+)
+
+# Upper bound on the PDF text embedded in the analysis prompt, in characters; longer
+# content is truncated so one oversized upload cannot blow up token cost and latency
+MAX_PDF_PROMPT_CHARS = 60000
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(LLM_CACHE_PATH)
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache(key TEXT PRIMARY KEY, value TEXT, created_at INTEGER)"
+    )
+    return conn
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pdfium():
+    """pypdfium2 (faster PDF text extraction) when installed, else None; imported on first use."""
+    try:
+        import pypdfium2  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return pypdfium2
+
+
+def _cache_key(pdf_content: str, symbols: list, model_name: str) -> str:
+    """Canonical key: symbol order does not matter, content and model do."""
+    raw = pdf_content + "\x00" + ",".join(sorted(symbols)) + "\x00" + model_name
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    try:
+        row = _cache_conn().execute("SELECT value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache lookup failed: {str(e)}")
+        return None
+    return row[0] if row else None
+
+
+def _cache_put(key: str, value: str) -> None:
+    try:
+        conn = _cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache(key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, int(time.time())),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache write failed: {str(e)}")
+
 
 class SocialMediaAnalyzer:
     """Social Media Cryptocurrency Analyzer"""
@@ -39,6 +97,9 @@ class SocialMediaAnalyzer:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
 
+        # Imported here so importing this module does not pay for the openai client stack
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key)
         self.model_name = os.environ.get('OPENAI_MODEL', 'gpt-4o')
 
@@ -57,21 +118,40 @@ class SocialMediaAnalyzer:
         try:
             logger.info(f"Reading PDF file: {pdf_path}")
 
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
+            pdfium = _load_pdfium()
+            if pdfium is not None:
+                pages = self._extract_pages_pdfium(pdfium, pdf_path)
+            else:
+                import PyPDF2
+
+                with open(pdf_path, 'rb') as file:
+                    pdf_reader = PyPDF2.PdfReader(file)
+                    pages = [page.extract_text() for page in pdf_reader.pages]
 
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
+            text = "".join(page_text + "\n\n" for page_text in pages)
 
-            logger.info(f"Successfully read {len(pdf_reader.pages)} pages from PDF")
+            logger.info(f"Successfully read {len(pages)} pages from PDF")
             return text
 
         except Exception as e:
             logger.error(f"Failed to read PDF: {str(e)}")
             raise
 
+    @staticmethod
+    def _extract_pages_pdfium(pdfium, pdf_path: str) -> list:
+        """Extract the text of each page with PDFium, normalizing its CRLF line breaks."""
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            pages = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+                page.close()
+            return pages
+        finally:
+            pdf.close()
+
     def analyze_symbols(self, pdf_content: str, symbols: list) -> dict:
         """
         Analyze cryptocurrency symbols to find the one requiring the most attention.
@@ -81,11 +161,25 @@ class SocialMediaAnalyzer:
             symbols: List of cryptocurrency symbols to analyze.
 
         Returns:
-            JSON dictionary of the analysis result.
+            JSON dictionary of the analysis result. On failure:
+            {'success': False, 'error': str, 'timestamp': float UNIX seconds}.
         """
         try:
             logger.info(f"Starting analysis for {len(symbols)} cryptocurrency symbols...")
 
+            if len(pdf_content) > MAX_PDF_PROMPT_CHARS:
+                logger.warning(
+                    f"PDF content truncated from {len(pdf_content)} to {MAX_PDF_PROMPT_CHARS} characters for the prompt"
+                )
+                pdf_content = pdf_content[:MAX_PDF_PROMPT_CHARS]
+
+            # Same PDF content, symbol set and model -> reuse the stored response
+            cache_key = _cache_key(pdf_content, symbols, self.model_name)
+            cached = _cache_get(cache_key)
+            if cached:
+                logger.info("Analysis served from cache")
+                return json.loads(cached)
+
             # Construct the prompt
             prompt = f"""You are a professional cryptocurrency market analyst and social media intelligence expert.
 
@@ -135,7 +229,9 @@ Please return the analysis result in JSON format, containing only the one symbol
             )
 
             # Parse response
-            result = json.loads(response.choices[0].message.content)
+            content = response.choices[0].message.content
+            result = json.loads(content)
+            _cache_put(cache_key, content)
 
             logger.info("Analysis complete")
             return result
@@ -145,7 +241,7 @@ Please return the analysis result in JSON format, containing only the one symbol
             return {
                 'success': False,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             }
 
     def save_result(self, result: dict, output_path: str):